@@ -1,14 +1,21 @@
 import streamlit as st
 import os
-from PIL import Image
 import tempfile
 import time
+import shutil
+import uuid
+import hashlib
+import threading
+import importlib.util
+import functools
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-from video_generator import AutoVideoGenerator
 from config import Config
 from utils.config_manager import config_manager
 from utils.api_key_ui import render_api_key_setup, show_api_key_status
+from utils.ui_helpers import thumbnail, example_topic_pills
 
 # Streamlit 페이지 설정
 st.set_page_config(
@@ -19,7 +26,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS_BLOCK = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -62,13 +69,782 @@ st.markdown("""
         border: 1px solid #99d6ff;
         color: #004085;
     }
+    
+    /* 오디오 레벨 미터 */
+    .level-meter {
+        margin: 10px 0;
+    }
+    
+    .level-label {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-bottom: 5px;
+    }
+    
+    .level-track {
+        width: 100%;
+        height: 20px;
+        background: #ddd;
+        border-radius: 10px;
+        overflow: hidden;
+    }
+    
+    .level-track.rms {
+        height: 25px;
+        border-radius: 12px;
+        border: 2px solid #ccc;
+    }
+    
+    .level-track.clip {
+        border-color: red;
+    }
+    
+    .level-fill {
+        height: 100%;
+        transition: width 0.1s ease;
+        border-radius: 8px;
+    }
+    
+    .level-status {
+        display: flex;
+        justify-content: space-between;
+        margin: 10px 0;
+    }
+    
+    .recording-banner {
+        background: linear-gradient(90deg, #ff4444, #ff6666);
+        color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        margin: 1rem 0;
+        animation: pulse 2s infinite;
+    }
+    
+    @keyframes pulse {
+        0% { opacity: 1; }
+        50% { opacity: 0.7; }
+        100% { opacity: 1; }
+    }
+    
+    .rec-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr 1fr;
+        gap: 0.75rem;
+        margin: 10px 0;
+    }
+    
+    .rec-grid.two-col {
+        grid-template-columns: 1fr 1fr;
+    }
+    
+    .rec-grid span {
+        font-size: 1.5rem;
+    }
+    
+    .app-footer {
+        text-align: center;
+        color: #666;
+        padding: 2rem;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Additional features boxes (static HTML)
+_FEATURES_HTML_1 = """
+<div class="feature-box">
+    <h3>🎨 Styles Available</h3>
+    <p>• <b>Modern</b>: Clean gradients, subtle animations<br>
+    • <b>Classic</b>: Professional, traditional news look<br>
+    • <b>Dramatic</b>: Bold colors, dynamic effects</p>
+</div>
+"""
+
+_FEATURES_HTML_2 = """
+<div class="feature-box">
+    <h3>🗣️ Voice Options</h3>
+    <p>• <b>Voice Cloning</b>: Extract from video/audio files<br>
+    • <b>Microphone Recording</b>: Record your own voice<br>
+    • <b>ElevenLabs</b>: Premium AI voices<br>
+    • <b>Azure</b>: Microsoft's speech service<br>
+    • <b>Basic</b>: Fallback TTS option</p>
+</div>
+"""
+
+_FEATURES_HTML_3 = """
+<div class="feature-box">
+    <h3>⚡ Quick Features</h3>
+    <p>• Auto script generation<br>
+    • Dynamic subtitles<br>
+    • Background music mixing<br>
+    • Multiple export formats</p>
+</div>
+"""
+
+_HEADER_HTML = """
+<h1 class="main-header">🎬 AutoAvatar</h1>
+<p style="text-align: center; font-size: 1.2rem; color: #666;">AI 기반 뉴스 비디오 생성기</p>
+"""
+
+_FOOTER_HTML = """
+<div class="app-footer">
+    <p>🎬 AutoAvatar - AI 뉴스 비디오 생성기</p>
+    <p>❤️ Streamlit, OpenAI, MoviePy로 제작</p>
+</div>
+"""
+
+st.html(_CSS_BLOCK)
+
+def _save_upload(upload, path):
+    """Stream an uploaded file to disk in 1 MiB chunks"""
+    upload.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(upload, f, length=1 << 20)
+
+# 업로드 파일은 내용 해시별 폴더에 한 번만 저장
+UPLOAD_ROOT = Path(tempfile.gettempdir()) / "autoavatar"
+
+# 녹음 파일과 음성 샘플 세션 폴더 위치
+TEMP_ROOT = Path(Config.TEMP_DIR)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _persist_upload(name, file_id, _upload):
+    """Stream an upload once under a content-addressed temp dir"""
+    # file_id로 캐시하므로 재실행마다 업로드 전체를 해시하지 않음
+    path = UPLOAD_ROOT / _upload_digest(_upload) / Path(name).name
+    _prepare_upload_path(_upload, path)
+    return str(path)
+
+def _prepare_upload_path(upload, path):
+    """Save an upload at path, or mark an existing content dir as recently used"""
+    if path.exists():
+        # 다른 세션이 재사용 중인 폴더를 오래된 것으로 보고 지우지 않도록 mtime 갱신
+        try:
+            os.utime(path.parent)
+            return
+        except FileNotFoundError:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _save_upload(upload, path)
+
+def _remember_upload(state_key, upload):
+    """Store the persisted path of an upload in session_state, once per file_id"""
+    # 같은 업로드로 재실행될 때는 캐시 조회도 건너뜀
+    id_key = f"{state_key}_file_id"
+    cached_path = st.session_state.get(state_key)
+    if st.session_state.get(id_key) != upload.file_id or not cached_path:
+        st.session_state[state_key] = _persist_upload(upload.name, upload.file_id, upload)
+        st.session_state[id_key] = upload.file_id
+    elif not os.path.exists(cached_path):
+        # 정리 작업으로 폴더가 지워졌으면 같은 경로에 다시 저장 (메모이즈된 경로는 그대로 유효)
+        _prepare_upload_path(upload, Path(cached_path))
+    return st.session_state[state_key]
+
+def _cleanup_upload_dirs(days_old):
+    """Remove upload dirs older than days_old and leftover .trash_* dirs"""
+    # 중단된 삭제가 남긴 .trash_* 는 나이와 관계없이 정리 (음성 세션 폴더 쪽 포함)
+    _sweep_trash_dirs(TEMP_ROOT)
+    _sweep_trash_dirs(UPLOAD_ROOT)
+    if not UPLOAD_ROOT.exists():
+        return 0
+    
+    cutoff_time = time.time() - days_old * 24 * 60 * 60
+    removed = 0
+    with os.scandir(UPLOAD_ROOT) as entries:
+        for entry in entries:
+            # .trash_* 는 위에서 처리
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            if entry.stat().st_mtime < cutoff_time and _remove_dir_async(entry.path):
+                removed += 1
+    
+    if removed:
+        _persist_upload.clear()
+    return removed
+
+@st.cache_resource
+def _io_pool():
+    """Worker pool shared across sessions for slow filesystem work"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def _sweep_trash_dirs(root):
+    """Delete .trash_* dirs left behind by interrupted removals"""
+    # 진행 중인 삭제와 겹쳐도 ignore_errors라 무해함
+    if not root.exists():
+        return
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith('.trash_') and entry.is_dir():
+                _io_pool().submit(shutil.rmtree, entry.path, ignore_errors=True)
+
+def _remove_dir_async(path):
+    """Hide a directory by renaming it, then delete it on the I/O pool"""
+    # 이름을 먼저 바꿔서 삭제가 끝나기 전에도 목록에 다시 나타나지 않게 함
+    # 이미 없거나 다른 세션이 먼저 옮긴 폴더는 None 반환
+    trash_path = os.path.join(os.path.dirname(path), f".trash_{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        return None
+    return _io_pool().submit(shutil.rmtree, trash_path, ignore_errors=True)
+
+def _upload_digest(upload):
+    """BLAKE2b-128 of an uploaded file, read in 1 MiB chunks"""
+    upload.seek(0)
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: upload.read(1 << 20), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+@st.cache_resource
+def _generation_pool():
+    """Worker pool shared across sessions for OpenAI/TTS-bound video jobs"""
+    # 공유 생성기의 VideoComposer가 temp_files 목록을 인스턴스에 들고 있으므로
+    # 모든 세션을 합쳐 한 번에 하나씩만 생성 (나머지는 대기열에서 기다림)
+    return ThreadPoolExecutor(max_workers=1)
+
+@st.cache_resource
+def _background_pool():
+    """Worker pool shared across sessions for long voice extraction jobs"""
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_resource
+def _recording_pool():
+    """Worker pool shared across sessions for microphone recordings"""
+    # 추출 작업 뒤에 줄 서지 않도록 별도 풀 사용 (녹음 버튼을 누르면 바로 캡처 시작)
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource
+def _voice_extraction_jobs():
+    """Voice extraction futures shared across sessions, keyed by media BLAKE2b digest"""
+    return {}
+
+def _run_voice_extraction(gen, upload, media_digest):
+    """Save the media file and extract voice samples (runs on a worker thread)"""
+    media_path = UPLOAD_ROOT / media_digest / Path(upload.name).name
+    _prepare_upload_path(upload, media_path)
+    return gen.create_voice_samples_from_media(str(media_path))
+
+def _record_voice_session(gen, samples_dir, **record_kwargs):
+    """Record from the microphone, then cut voice samples from it (runs on a worker thread)"""
+    record_result = gen.record_voice_from_microphone(**record_kwargs)
+    samples_result = None
+    if record_result.get("success"):
+        samples_result = gen.tts_engine.create_voice_samples(record_kwargs['output_path'], samples_dir)
+    return record_result, samples_result
+
+def _submit_voice_extraction(gen, upload, media_digest):
+    """Reuse a running or successful extraction of the same media, else start one"""
+    jobs = _voice_extraction_jobs()
+    future = jobs.get(media_digest)
+    if future is not None:
+        if not future.done():
+            return future
+        if future.exception() is None:
+            result = future.result()
+            # 샘플 폴더가 삭제되지 않았으면 이전 결과 재사용
+            if result.get("success") and os.path.isdir(result['voice_samples_dir']):
+                return future
+    
+    future = _background_pool().submit(_run_voice_extraction, gen, upload, media_digest)
+    jobs[media_digest] = future
+    while len(jobs) > 8:
+        jobs.pop(next(iter(jobs)))
+    return future
+
+@st.fragment(run_every=0.5)
+def _voice_extraction_status():
+    """Poll the running voice extraction, rerun the app once it finishes"""
+    future = st.session_state.voice_extraction_future
+    if not future.done():
+        st.info("🎵 미디어에서 음성 추출 중...")
+        return
+    
+    del st.session_state.voice_extraction_future
+    try:
+        result = future.result()
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+    
+    if result.get("success"):
+        # 세션 정보 저장
+        st.session_state.voice_session_id = result['session_id']
+        st.session_state.voice_samples_dir = result['voice_samples_dir']
+        _scan_voice_sessions.clear()
+    st.session_state.voice_extraction_result = result
+    st.rerun()
+
+def _wav_duration(path):
+    """Duration of a WAV sample read from its header (safe on worker threads)"""
+    import soundfile as sf
+    
+    try:
+        info = sf.info(path)
+        return info.frames / info.samplerate
+    except Exception:
+        return 0
+
+@st.cache_resource
+def _wav_duration_cache():
+    """WAV durations shared across sessions, keyed by (path, mtime, size)"""
+    return {}
+
+def _wav_metas(wav_entries):
+    """Duration and size in KB for (name, path, stat) entries; only uncached headers are read, in parallel"""
+    # 캐시 조회는 스크립트 스레드에서, 풀에는 st 호출 없는 헤더 읽기만 넘김
+    cache = _wav_duration_cache()
+    if len(cache) > 1024:
+        cache.clear()
+    keys = [(path, stat.st_mtime, stat.st_size) for _, path, stat in wav_entries]
+    # 다른 세션이 캐시를 비워도 되도록 이번 실행분은 지역 dict로 들고 있음
+    durations = {key: cache.get(key) for key in keys}
+    missing = [key for key, duration in durations.items() if duration is None]
+    if missing:
+        read = dict(zip(missing, _io_pool().map(_wav_duration, [key[0] for key in missing])))
+        durations.update(read)
+        cache.update(read)
+    return [{'duration': durations[key], 'size': key[2] / 1024} for key in keys]  # KB
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _scan_voice_sessions(temp_dir):
+    """Saved voice_samples_* sessions with sample count and size in KB"""
+    sessions = []
+    if not os.path.isdir(temp_dir):
+        return sessions
+    
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if not (entry.name.startswith('voice_samples_') and entry.is_dir()):
+                continue
+            
+            sample_count = 0
+            folder_size = 0
+            with os.scandir(entry.path) as files:
+                for f in files:
+                    if f.is_file():
+                        folder_size += f.stat().st_size
+                        sample_count += f.name.endswith('.wav')
+            
+            sessions.append({
+                'id': entry.name.replace('voice_samples_', ''),
+                'path': entry.path,
+                'samples': sample_count,
+                'size': folder_size / 1024  # KB
+            })
+    return sessions
+
+# 이 크기를 넘는 비디오는 캐시하지 않고 파일에서 바로 전달
+VIDEO_CACHE_LIMIT = 50 * 1024 * 1024
+
+# bytes는 불변이므로 cache_resource로 같은 객체를 공유 (cache_data처럼 매번 역직렬화 복사하지 않음)
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _read_video_bytes(path, mtime):
+    """Read a rendered video once per (path, mtime)"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _render_video(video_path, download_label, file_name):
+    """Show the video player and download button for a rendered video"""
+    if os.path.getsize(video_path) > VIDEO_CACHE_LIMIT:
+        st.video(video_path)
+        # 큰 파일은 사용자가 요청할 때만 읽어서 다운로드 버튼에 넘김
+        armed_key = f"download_armed_{video_path}"
+        if not st.session_state.get(armed_key):
+            st.button(download_label, key=f"arm_{video_path}",
+                      on_click=st.session_state.__setitem__, args=(armed_key, True))
+            return
+        # 다운로드를 누를 때까지 유지하고, 누르면 해제해서 이후 재실행에서는 다시 읽지 않음
+        with open(video_path, 'rb') as f:
+            st.download_button(label=download_label, data=f, file_name=file_name, mime="video/mp4",
+                               on_click=st.session_state.pop, args=(armed_key, None))
+        return
+    
+    video_bytes = _read_video_bytes(video_path, os.path.getmtime(video_path))
+    st.video(video_bytes)
+    st.download_button(label=download_label, data=video_bytes, file_name=file_name, mime="video/mp4")
+
+@st.cache_resource(show_spinner="비디오 생성기를 준비하는 중...")
+def get_generator(openai_key, elevenlabs_key, azure_key):
+    """Shared AutoVideoGenerator, rebuilt only when the API keys change"""
+    # MoviePy/torch/whisper 등 무거운 의존성은 여기서 처음 로드
+    from video_generator import AutoVideoGenerator
+    
+    return AutoVideoGenerator()
+
+def _current_generator():
+    """Shared generator for the API keys currently loaded into Config"""
+    return get_generator(Config.OPENAI_API_KEY, Config.ELEVENLABS_API_KEY, Config.AZURE_SPEECH_KEY)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_setup_validation(_gen, gen_id):
+    """Setup validation result for a generator instance"""
+    return _gen.validate_setup()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_microphones(_gen, gen_id, nonce):
+    """Audio input devices, enumerated again only when the refresh nonce changes"""
+    return _gen.get_available_microphones()
+
+def _session_audio_monitor():
+    """This session's microphone level monitor (the generator is shared across sessions)"""
+    if 'audio_monitor' not in st.session_state:
+        from utils.voice_cloner import AudioMonitor
+        st.session_state.audio_monitor = AudioMonitor()
+    return st.session_state.audio_monitor
+
+@st.fragment
+def _api_setup_ui():
+    """API key setup page, rerun on its own while keys are being typed"""
+    render_api_key_setup()
+
+# 오디오 레벨 바 템플릿 (숫자/색상만 채워 넣음)
+# (스타일은 _CSS_BLOCK의 level-* 클래스에 한 번만 정의)
+_RMS_BAR_HTML = """
+<div class="level-meter">
+    <div class="level-label">
+        <span><strong>🎤 RMS 레벨</strong></span>
+        <span style="color: {label_color};">{percentage:.1f}% {clip_label}</span>
+    </div>
+    <div class="level-track rms{track_class}">
+        <div class="level-fill" style="width: {percentage}%; background: {color};"></div>
+    </div>
+</div>
+"""
+
+_PEAK_BAR_HTML = """
+<div class="level-meter">
+    <div class="level-label">
+        <span><strong>📈 피크 레벨</strong></span>
+        <span>{percentage:.1f}%</span>
+    </div>
+    <div class="level-track">
+        <div class="level-fill" style="width: {percentage}%; background: {color};"></div>
+    </div>
+</div>
+"""
+
+_LEVEL_CHECK_HTML = """
+<div class="rec-grid two-col">
+    <div><small>RMS 레벨</small><br><span>{rms:.1f}%</span></div>
+    <div><small>피크 레벨</small><br><span>{peak:.1f}%</span></div>
+    <div><small>신호 품질</small><br><span>{quality}</span></div>
+    <div><small>클리핑</small><br><strong style="color: {clip_color};">{clip_text}</strong></div>
+</div>
+"""
+
+# (위험 << 1) | (80% 초과) 인덱스로 색상 선택
+_LEVEL_COLORS = ("green", "orange", "red", "red")
+
+# (70% 이상) + (90% 이상) 인덱스로 녹음 중 레벨 색상 선택
+_RECORDING_LEVEL_COLORS = ("green", "orange", "red")
+
+# (RMS > 0.01) + (RMS > 0.1) 인덱스로 신호 품질 선택
+_SIGNAL_QUALITIES = (("낮음", "red"), ("보통", "orange"), ("좋음", "green"))
+
+# (클리핑 << 1) | (RMS > 0.05) 인덱스로 상태 선택
+_METER_STATUSES = (
+    ("orange", "🔇 조용함"),
+    ("green", "✅ 정상"),
+    ("red", "⚠️ 클리핑"),
+    ("red", "⚠️ 클리핑"),
+)
+
+_METER_STATUS_HTML = """
+<div class="level-status">
+    <span><strong>신호 품질:</strong> <span style="color: {quality_color};">{signal_quality}</span></span>
+    <span><strong>적용된 게인:</strong> {gain:.1f}x</span>
+    <span><strong>상태:</strong> <span style="color: {status_color};">{status_text}</span></span>
+</div>
+"""
+
+@st.fragment(run_every=0.1)
+def _audio_level_meter(get_level):
+    """Live RMS/peak meter, reruns on its own while monitoring is active"""
+    # 오디오 레벨 데이터 가져오기 (서버 마이크 또는 브라우저 마이크)
+    level_data = get_level()
+    rms_level = level_data.rms_level
+    peak_level = level_data.peak_level
+    clipping = level_data.clipping
+    
+    # RMS 레벨 바
+    rms_percentage = min(100, rms_level * 100)
+    rms_color = _LEVEL_COLORS[(clipping << 1) | (rms_percentage > 80)]
+    
+    rms_html = _RMS_BAR_HTML.format(
+        percentage=rms_percentage,
+        color=rms_color,
+        label_color='red' if clipping else 'inherit',
+        clip_label='🚨 CLIP!' if clipping else '',
+        track_class=' clip' if clipping else ''
+    )
+    
+    # 피크 레벨 바
+    peak_percentage = min(100, peak_level * 100)
+    peak_color = _LEVEL_COLORS[((peak_percentage > 95) << 1) | (peak_percentage > 80)]
+    
+    peak_html = _PEAK_BAR_HTML.format(
+        percentage=peak_percentage,
+        color=peak_color
+    )
+    
+    # 상태 표시
+    signal_quality, quality_color = _SIGNAL_QUALITIES[(rms_level > 0.01) + (rms_level > 0.1)]
+    status_color, status_text = _METER_STATUSES[(clipping << 1) | (rms_level > 0.05)]
+    
+    status_html = _METER_STATUS_HTML.format(
+        quality_color=quality_color,
+        signal_quality=signal_quality,
+        gain=level_data.gain,
+        status_color=status_color,
+        status_text=status_text
+    )
+    
+    # 바 두 개와 상태 줄을 한 번에 전송 (마크다운 파싱 없이)
+    st.html(rms_html + peak_html + status_html)
+
+# 녹음 카드 전체 (배너 + 진행률 + 레벨 + 시간 정보)를 한 번에 전송하는 템플릿
+_RECORDING_CARD_HTML = """
+<div class="recording-banner"><h3>🔴 녹음 중... (게인: {gain:.1f}x)</h3></div>
+<div class="level-meter">
+    <div class="level-label">
+        <span>진행률: {progress:.1f}% | {elapsed:.1f}s / {duration}s</span>
+        <span>음성 레벨 {level:.0f}%</span>
+    </div>
+    <div class="level-track">
+        <div class="level-fill" style="width: {progress:.1f}%; background: #ff4b4b;"></div>
+    </div>
+    <div class="level-track" style="margin-top: 5px;">
+        <div class="level-fill" style="width: {level:.1f}%; background: {level_color};"></div>
+    </div>
+</div>
+<div class="rec-grid">
+    <div><small>경과 시간</small><br><span>{elapsed:.1f}초</span></div>
+    <div><small>남은 시간</small><br><span>{remaining:.1f}초</span></div>
+    <div><small>게인 상태</small><br><span>{gain_status}</span></div>
+</div>
+"""
+
+@st.fragment(run_every=0.3)
+def _recording_progress(record_duration, gain_multiplier):
+    """Recording progress card, reruns on its own until recording stops"""
+    recording = st.session_state.recording_process
+    
+    # 녹음 스레드가 보낸 진행 상황 중 가장 최근 것 (슬롯 하나짜리 deque)
+    progress_slot = recording['progress']
+    latest = progress_slot[-1] if progress_slot else None
+    
+    # 눈에 띄는 변화가 있을 때만 session_state 갱신
+    previous = st.session_state.recording_progress_data
+    if latest is not None and (
+        previous is None
+        or abs(latest['audio_level'] - previous['audio_level']) > 0.01
+        or latest['progress'] - previous['progress'] > 0.005
+    ):
+        st.session_state.recording_progress_data = latest
+    
+    # 녹음 중 상태 표시 (실제 녹음된 프레임 기준, 아직 없으면 경과 시간)
+    if st.session_state.recording_progress_data:
+        elapsed_time = st.session_state.recording_progress_data['elapsed_time']
+    else:
+        elapsed_time = min(time.time() - st.session_state.recording_start_time, record_duration)
+    remaining_time = max(0, record_duration - elapsed_time)
+    
+    # 진행 상황 표시
+    progress = min(elapsed_time / record_duration, 1.0)
+    
+    data = st.session_state.recording_progress_data
+    level_percentage = min(100, max(0, data['audio_level'] * 100)) if data else 0
+    
+    # 배너, 진행률, 레벨, 시간 정보를 요소 하나로 전송
+    st.html(_RECORDING_CARD_HTML.format(
+        gain=gain_multiplier,
+        progress=progress * 100,
+        elapsed=elapsed_time,
+        duration=record_duration,
+        remaining=remaining_time,
+        level=level_percentage,
+        level_color=_RECORDING_LEVEL_COLORS[(level_percentage >= 70) + (level_percentage >= 90)],
+        gain_status="🔊 정상" if gain_multiplier <= 2.0 else "⚠️ 높음"
+    ))
+    
+    # 통계는 데이터가 도착한 뒤에 채우되 자리는 먼저 잡아 둠
+    stats_slot = st.empty()
+    if data:
+        # 실시간 오디오 통계
+        with stats_slot.expander("📊 실시간 오디오 통계", expanded=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write(f"**오디오 레벨:** {data.get('audio_level', 0):.3f}")
+                st.write(f"**적용된 게인:** {data.get('gain', 1.0):.1f}x")
+            with col2:
+                st.write(f"**진행률:** {data.get('progress', 0)*100:.1f}%")
+                if data.get('audio_level', 0) > 0.9:
+                    st.warning("⚠️ 오디오 레벨이 높습니다!")
+    
+    # 정지 버튼 (크고 눈에 띄게)
+    if st.button("⏹️ 녹음 정지", key="stop_recording_btn", type="secondary", use_container_width=True):
+        recording['stop_event'].set()
+    
+    # 녹음 스레드가 끝나면 (시간 종료 또는 정지) 결과 처리로 전환
+    if recording['future'].done():
+        st.session_state.recording_state = 'processing'
+        st.rerun()
+
+# 브라우저 마이크 캡처는 선택 의존성 (aiortc가 무거우므로 사용 시점에 import)
+WEBRTC_AVAILABLE = importlib.util.find_spec("streamlit_webrtc") is not None
+
+def _browser_audio_monitor(gain_multiplier):
+    """Capture the mic in the browser over WebRTC and show its level"""
+    import numpy as np
+    from streamlit_webrtc import webrtc_streamer, WebRtcMode
+    # 생성기가 이미 로드한 모듈이라 추가 비용 없음
+    from utils.voice_cloner import AudioLevel
+    
+    if 'browser_audio_level' not in st.session_state:
+        st.session_state.browser_audio_level = {'level': AudioLevel(0.0, 0.0, 1.0, False, 0.0)}
+    holder = st.session_state.browser_audio_level
+    
+    def audio_frame_callback(frame):
+        # WebRTC 스레드에서 실행되므로 session_state가 아닌 holder에 기록
+        audio_chunk = frame.to_ndarray().astype(np.float32)
+        audio_chunk *= gain_multiplier
+        
+        rms_normalized = min(1.0, float(np.sqrt(np.mean(audio_chunk ** 2))) / 32767.0)
+        peak_normalized = min(1.0, float(np.max(np.abs(audio_chunk))) / 32767.0)
+        holder['level'] = AudioLevel(
+            rms_normalized, peak_normalized, gain_multiplier, peak_normalized > 0.95, time.time()
+        )
+        return frame
+    
+    ctx = webrtc_streamer(
+        key="browser_mic",
+        mode=WebRtcMode.SENDONLY,
+        audio_frame_callback=audio_frame_callback,
+        media_stream_constraints={"audio": True, "video": False}
+    )
+    
+    if ctx.state.playing:
+        _audio_level_meter(lambda: holder['level'])
+
+# main()에서 매 실행 시작 시 setdefault로 채우는 세션 키
+_SESSION_DEFAULTS = {
+    'voice_session_id': None,
+    'voice_samples_dir': None,
+    'current_gain': 1.0,
+    'current_mic_index': None,
+    'record_duration': 20,
+    'audio_monitoring': False,
+    'recording_state': 'idle',  # idle, recording, processing
+    'recording_start_time': None,
+    'recording_process': None,
+    'recording_progress_data': None,
+    'temp_image_path': None,
+    'temp_music_path': None,
+    'temp_face_path': None,
+}
+
+@st.fragment
+def _video_generation_tab(voice_provider, duration, style, show_script, show_timing, enable_lipsync):
+    """News video tab; its own widgets rerun only this tab, not the sidebar"""
+    # 비디오 생성 인터페이스
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.header("📸 이미지 업로드")
+        
+        uploaded_file = st.file_uploader(
+            "이미지 파일을 선택하세요",
+            type=['png', 'jpg', 'jpeg', 'bmp', 'tiff'],
+            help="비디오에 사용할 인물 사진이나 이미지를 업로드하세요"
+        )
+
+    if uploaded_file is not None:
+        # 업로드된 이미지 표시
+        st.image(thumbnail(uploaded_file.file_id, uploaded_file), caption="업로드된 이미지", use_container_width=True)
+        
+        # Save uploaded file temporarily (once per unique upload)
+        _remember_upload('temp_image_path', uploaded_file)
+        
+        # 배경음악 업로드
+        st.subheader("🎵 배경음악 (선택사항)")
+        music_file = st.file_uploader(
+            "배경음악을 선택하세요",
+            type=['mp3', 'wav', 'aac'],
+            help="비디오에 사용할 배경음악을 업로드하세요 (선택사항)"
+        )
+        
+        if music_file is not None:
+            _remember_upload('temp_music_path', music_file)
+            st.success("🎵 배경음악이 업로드되었습니다!")
+
+        with col2:
+            st.header("📝 뉴스 주제")
+            
+            # 예시 주제들
+            with st.expander("💡 예시 주제들"):
+                example_topics = [
+                    "손흥민 레알 마드리드 이적설",
+                    "의료 연구 분야 AI 혁신 기술 발표",
+                    "기후변화 정상회의 역사적 합의 도출",
+                    "대형 IT 기업 혁신적 스마트폰 발표",
+                    "올림픽 관중 동원 기록 경신",
+                    "화성 탐사 미션에서 물 발견"
+                ]
+                
+                example_topic_pills(example_topics, "news_topic")
+            
+            news_topic = st.text_area(
+                "뉴스 제목이나 주제를 입력하세요:",
+                value=st.session_state.get('news_topic', ''),
+                height=100,
+                placeholder="예: '속보: 손흥민 레알 마드리드 영입 확정'",
+                help="비디오로 만들고 싶은 뉴스 주제를 입력하세요"
+            )
+            
+            # 생성 버튼
+            generate_button = st.button(
+                "🚀 비디오 생성",
+                type="primary",
+                use_container_width=True,
+                disabled=not news_topic.strip(),
+                key="main_generate_btn"
+            )
+            
+            if generate_button:
+                if not st.session_state.temp_image_path:
+                    st.error("먼저 이미지를 업로드해주세요!")
+                elif not news_topic.strip():
+                    st.error("뉴스 주제를 입력해주세요!")
+                else:
+                    # 복제된 음성 사용 시 음성 샘플 디렉토리 가져오기
+                    voice_samples_dir = None
+                    if voice_provider == "cloned" and st.session_state.voice_samples_dir:
+                        voice_samples_dir = st.session_state.voice_samples_dir
+                    
+                    generate_video(
+                        st.session_state.temp_image_path,
+                        news_topic,
+                        duration,
+                        style.lower(),
+                        voice_provider,
+                        st.session_state.temp_music_path,
+                        voice_samples_dir,
+                        show_script,
+                        show_timing,
+                        enable_lipsync
+                    )
+            
+            # 렌더링 작업 상태 / 결과
+            show_video_job()
+    elif st.session_state.get('active_job_id'):
+        # 이미지가 없으면 입력 위젯은 그리지 않고 진행 중인 작업 상태만 표시
+        with col2:
+            show_video_job()
 
 def main():
     # 헤더
-    st.markdown('<h1 class="main-header">🎬 AutoAvatar</h1>', unsafe_allow_html=True)
-    st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">AI 기반 뉴스 비디오 생성기</p>', unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # 현재 API 키로 Config 업데이트
     Config.update_from_manager(config_manager)
@@ -77,18 +853,25 @@ def main():
     validation_results = config_manager.validate_api_keys()
     if not validation_results.get('openai', False):
         st.error("🔑 API 키 설정이 필요합니다!")
-        render_api_key_setup()
+        _api_setup_ui()
         st.stop()
     
-    # 비디오 생성기 초기화
-    if 'generator' not in st.session_state:
-        try:
-            st.session_state.generator = AutoVideoGenerator()
-        except Exception as e:
-            st.error(f"비디오 생성기 초기화 실패: {e}")
-            st.markdown("---")
-            render_api_key_setup()
-            st.stop()
+    # 비디오 생성기 초기화 (세션 간 공유)
+    try:
+        generator = _current_generator()
+    except Exception as e:
+        st.error(f"비디오 생성기 초기화 실패: {e}")
+        st.markdown("---")
+        _api_setup_ui()
+        st.stop()
+    
+    # 이 세션의 비디오 작업 목록 (실행은 공유 풀에서)
+    if 'jobs' not in st.session_state:
+        st.session_state.jobs = {}
+    
+    # 세션 상태 기본값은 여기서 한 번에 설정
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
     
     # 사이드바 설정
     with st.sidebar:
@@ -104,11 +887,10 @@ def main():
         st.markdown("---")
         
         # 시스템 검증
-        validation = st.session_state.generator.validate_setup()
+        validation = get_setup_validation(generator, id(generator))
         if not validation['valid']:
             st.error("⚠️ 설정 문제:")
-            for issue in validation['issues']:
-                st.write(f"• {issue}")
+            st.markdown("\n".join(f"- {issue}" for issue in validation['issues']))
             
             with st.expander("📝 설정 안내"):
                 st.markdown("""
@@ -131,17 +913,26 @@ def main():
         else:
             st.success("✅ 시스템 준비 완료")
         
-        # 음성 제공업체 선택
-        voice_info = st.session_state.generator.get_available_voices()
+        # 음성 제공업체 선택 (validate_setup 결과에 이미 포함됨)
+        voice_providers = validation['voice_providers']
+        providers_set = frozenset(voice_providers)
         voice_provider = st.selectbox(
             "🎤 음성 제공업체",
-            options=voice_info['providers'],
+            options=voice_providers,
             index=0,
             help="선호하는 텍스트-음성 변환 제공업체를 선택하세요"
         )
         
-        # 음성 복제 섹션
-        if "cloned" in voice_info['providers']:
+        # 음성 복제 섹션 (cloned 선택 시, 또는 녹음/추출 작업이 진행 중일 때만 그림)
+        # 서버 마이크 모니터링 중에는 중지 버튼이 사라지지 않도록 계속 그림
+        cloning_busy = (
+            st.session_state.recording_state != 'idle'
+            or 'voice_extraction_future' in st.session_state
+            or st.session_state.audio_monitoring
+        )
+        if "cloned" in providers_set and voice_provider != "cloned" and not cloning_busy:
+            st.caption("🎭 음성 복제 도구는 음성 제공업체를 'cloned'로 선택하면 표시됩니다.")
+        elif "cloned" in providers_set:
             st.subheader("🎭 음성 복제")
             
             voice_cloning_tab1, voice_cloning_tab2, voice_cloning_tab3 = st.tabs([
@@ -157,34 +948,37 @@ def main():
                     key="voice_media_uploader"
                 )
                 
+                extraction_running = 'voice_extraction_future' in st.session_state
                 if voice_media_file is not None:
-                    if st.button("🎵 음성 추출", key="extract_voice"):
-                        with st.spinner("미디어에서 음성 추출 중..."):
-                            # 업로드된 파일 저장
-                            temp_media_path = os.path.join(tempfile.gettempdir(), voice_media_file.name)
-                            with open(temp_media_path, "wb") as f:
-                                f.write(voice_media_file.getbuffer())
-                            
-                            # 음성 샘플 추출
-                            result = st.session_state.generator.create_voice_samples_from_media(temp_media_path)
-                            
-                            if result.get("success"):
-                                st.success(f"✅ 음성 추출 성공!")
-                                st.write(f"• **생성된 샘플:** {result['total_samples']}")
-                                st.write(f"• **최적 샘플:** {len(result['best_samples'])}")
-                                st.write(f"• **세션 ID:** {result['session_id']}")
-                                
-                                # 세션 정보 저장
-                                st.session_state.voice_session_id = result['session_id']
-                                st.session_state.voice_samples_dir = result['voice_samples_dir']
-                                
-                                # 샘플 품질 표시
-                                if result.get('best_samples'):
-                                    st.write("**샘플 품질:**")
-                                    for i, sample in enumerate(result['best_samples'][:3]):
-                                        st.write(f"  {i+1}. 길이: {sample['duration']:.1f}초, 품질: {sample['quality']:.2f}")
-                            else:
-                                st.error(f"❌ 음성 추출 실패: {result.get('error')}")
+                    if st.button("🎵 음성 추출", key="extract_voice", disabled=extraction_running):
+                        # 백그라운드에서 음성 샘플 추출 (같은 파일이면 이전 작업 재사용)
+                        media_digest = _upload_digest(voice_media_file)
+                        st.session_state.voice_extraction_future = _submit_voice_extraction(
+                            generator, voice_media_file, media_digest
+                        )
+                        st.session_state.pop('voice_extraction_result', None)
+                        extraction_running = True
+                
+                if extraction_running:
+                    _voice_extraction_status()
+                
+                result = st.session_state.get('voice_extraction_result')
+                if result is not None:
+                    if result.get("success"):
+                        st.success(f"✅ 음성 추출 성공!")
+                        st.write(f"• **생성된 샘플:** {result['total_samples']}")
+                        st.write(f"• **최적 샘플:** {len(result['best_samples'])}")
+                        st.write(f"• **세션 ID:** {result['session_id']}")
+                        
+                        # 샘플 품질 표시
+                        if result.get('best_samples'):
+                            quality_lines = "\n".join(
+                                f"{i+1}. 길이: {sample['duration']:.1f}초, 품질: {sample['quality']:.2f}"
+                                for i, sample in enumerate(result['best_samples'][:3])
+                            )
+                            st.markdown(f"**샘플 품질:**\n\n{quality_lines}")
+                    else:
+                        st.error(f"❌ 음성 추출 실패: {result.get('error')}")
             
             with voice_cloning_tab2:
                 st.write("**직접 음성 녹음:**")
@@ -194,10 +988,10 @@ def main():
                 
                 with col1:
                     if st.button("🎤 마이크 테스트", key="test_mic_btn"):
-                        current_mic = st.session_state.get('current_mic_index', None)
+                        current_mic = st.session_state.current_mic_index
                         
                         with st.spinner("마이크를 테스트하는 중..."):
-                            mic_test = st.session_state.generator.test_microphone(current_mic)
+                            mic_test = generator.test_microphone(current_mic)
                         
                         if mic_test.get("microphone_working"):
                             st.success(f"✅ 마이크 작동 중! 품질: {mic_test.get('quality', '알 수 없음')}")
@@ -226,19 +1020,14 @@ def main():
                 
                 with col2:
                     # 실시간 볼륨 모니터링 토글
-                    if 'audio_monitoring' not in st.session_state:
-                        st.session_state.audio_monitoring = False
-                    if 'audio_level_data' not in st.session_state:
-                        st.session_state.audio_level_data = {'rms_level': 0, 'peak_level': 0, 'clipping': False}
-                    
                     if st.button("📊 볼륨 모니터링", key="volume_monitor_btn"):
                         if not st.session_state.audio_monitoring:
                             # 모니터링 시작 (콜백 없이)
-                            current_gain = st.session_state.get('current_gain', 1.0)
-                            current_mic = st.session_state.get('current_mic_index', None)
+                            current_gain = st.session_state.current_gain
+                            current_mic = st.session_state.current_mic_index
                             
                             with st.spinner("오디오 모니터링을 시작하는 중..."):
-                                result = st.session_state.generator.start_audio_monitoring(
+                                result = _session_audio_monitor().start_audio_monitoring(
                                     device_index=current_mic,
                                     gain_multiplier=current_gain
                                 )
@@ -268,9 +1057,8 @@ def main():
                                     """)
                         else:
                             # 모니터링 중지
-                            st.session_state.generator.stop_audio_monitoring()
+                            _session_audio_monitor().stop_audio_monitoring()
                             st.session_state.audio_monitoring = False
-                            st.session_state.audio_level_data = {'rms_level': 0, 'peak_level': 0, 'clipping': False}
                             st.info("🔇 볼륨 모니터링 중지")
                             st.rerun()
                 
@@ -278,109 +1066,34 @@ def main():
                 if st.session_state.audio_monitoring:
                     st.markdown("### 🎚️ 실시간 오디오 레벨")
                     
-                    # 오디오 레벨 데이터 가져오기 (새로운 방식)
-                    level_data = st.session_state.generator.get_current_audio_level()
-                    rms_level = level_data.get('rms_level', 0)
-                    peak_level = level_data.get('peak_level', 0)
-                    clipping = level_data.get('clipping', False)
-                    
-                    # RMS 레벨 바
-                    rms_percentage = min(100, rms_level * 100)
-                    rms_color = "red" if clipping else "orange" if rms_percentage > 80 else "green"
-                    
-                    st.markdown(f"""
-                    <div style="margin: 10px 0;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
-                            <span><strong>🎤 RMS 레벨</strong></span>
-                            <span style="color: {'red' if clipping else 'inherit'};">
-                                {rms_percentage:.1f}% {'🚨 CLIP!' if clipping else ''}
-                            </span>
-                        </div>
-                        <div style="
-                            width: 100%;
-                            height: 25px;
-                            background: #ddd;
-                            border-radius: 12px;
-                            overflow: hidden;
-                            border: 2px solid {'red' if clipping else '#ccc'};
-                        ">
-                            <div style="
-                                width: {rms_percentage}%;
-                                height: 100%;
-                                background: linear-gradient(90deg, {rms_color}, {rms_color});
-                                transition: width 0.1s ease;
-                                border-radius: 10px;
-                            "></div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # 피크 레벨 바
-                    peak_percentage = min(100, peak_level * 100)
-                    peak_color = "red" if peak_percentage > 95 else "orange" if peak_percentage > 80 else "green"
-                    
-                    st.markdown(f"""
-                    <div style="margin: 10px 0;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
-                            <span><strong>📈 피크 레벨</strong></span>
-                            <span>{peak_percentage:.1f}%</span>
-                        </div>
-                        <div style="
-                            width: 100%;
-                            height: 20px;
-                            background: #ddd;
-                            border-radius: 10px;
-                            overflow: hidden;
-                        ">
-                            <div style="
-                                width: {peak_percentage}%;
-                                height: 100%;
-                                background: {peak_color};
-                                transition: width 0.1s ease;
-                                border-radius: 8px;
-                            "></div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # 상태 표시
-                    col1, col2, col3 = st.columns(3)
+                    _audio_level_meter(_session_audio_monitor().get_current_audio_level)
+                
+                # 브라우저 마이크 모니터링 (streamlit-webrtc 설치 시)
+                if WEBRTC_AVAILABLE:
+                    with st.expander("🌐 브라우저 마이크로 레벨 확인", expanded=False):
+                        st.caption("서버 마이크 대신 브라우저에서 직접 캡처합니다 (원격 배포 환경용)")
+                        _browser_audio_monitor(st.session_state.current_gain)
+                
+                # 녹음 설정 (슬라이더를 움직여도 '적용'을 누를 때 한 번만 다시 실행)
+                # 초기값은 세션 상태에서 읽어 탭이 숨겨졌다 다시 나타나도 설정 유지
+                with st.form("rec_settings", clear_on_submit=False, border=False):
+                    col1, col2 = st.columns(2)
                     with col1:
-                        signal_quality = "좋음" if rms_level > 0.1 else "보통" if rms_level > 0.01 else "낮음"
-                        quality_color = "green" if rms_level > 0.1 else "orange" if rms_level > 0.01 else "red"
-                        st.markdown(f"**신호 품질:** <span style='color: {quality_color}'>{signal_quality}</span>", unsafe_allow_html=True)
-                    
+                        record_duration = st.slider("녹음 시간 (초)", 10, 60, st.session_state.record_duration)
                     with col2:
-                        gain_status = f"{level_data.get('gain', 1.0):.1f}x"
-                        st.markdown(f"**적용된 게인:** {gain_status}")
-                    
-                    with col3:
-                        if clipping:
-                            st.markdown("**상태:** <span style='color: red'>⚠️ 클리핑</span>", unsafe_allow_html=True)
-                        elif rms_level > 0.05:
-                            st.markdown("**상태:** <span style='color: green'>✅ 정상</span>", unsafe_allow_html=True)
-                        else:
-                            st.markdown("**상태:** <span style='color: orange'>🔇 조용함</span>", unsafe_allow_html=True)
-                    
-                    # 자동 새로고침 (모니터링 중일 때만)
-                    time.sleep(0.1)
-                    st.rerun()
+                        gain_multiplier = st.slider(
+                            "입력 게인 (배율)", 
+                            min_value=0.1, 
+                            max_value=5.0, 
+                            value=st.session_state.current_gain, 
+                            step=0.1,
+                            help="마이크 입력 음량을 조정합니다. 1.0이 기본값입니다."
+                        )
+                    st.form_submit_button("✅ 녹음 설정 적용", use_container_width=True)
                 
-                # 녹음 설정
-                col1, col2 = st.columns(2)
-                with col1:
-                    record_duration = st.slider("녹음 시간 (초)", 10, 60, 20)
-                with col2:
-                    gain_multiplier = st.slider(
-                        "입력 게인 (배율)", 
-                        min_value=0.1, 
-                        max_value=5.0, 
-                        value=1.0, 
-                        step=0.1,
-                        help="마이크 입력 음량을 조정합니다. 1.0이 기본값입니다."
-                    )
-                    # 세션 상태에 저장
-                    st.session_state.current_gain = gain_multiplier
+                # 세션 상태에 저장
+                st.session_state.record_duration = record_duration
+                st.session_state.current_gain = gain_multiplier
                 
                 # 게인 레벨 표시 및 실시간 반영
                 if gain_multiplier < 0.5:
@@ -390,34 +1103,35 @@ def main():
                 else:
                     st.success("🔊 적정 게인: 권장 설정")
                 
-                # 게인 변경 시 모니터링 업데이트
+                # 게인 변경 시 모니터링 업데이트 (스트림 재시작 없이 게인만 반영)
                 if st.session_state.audio_monitoring:
-                    # 현재 게인과 저장된 게인이 다르면 모니터링 재시작
-                    if 'last_gain' not in st.session_state:
-                        st.session_state.last_gain = gain_multiplier
-                    elif abs(st.session_state.last_gain - gain_multiplier) > 0.1:
-                        st.session_state.last_gain = gain_multiplier
-                        # 모니터링 재시작 (콜백 없이)
-                        st.session_state.generator.stop_audio_monitoring()
-                        
-                        st.session_state.generator.start_audio_monitoring(
-                            device_index=st.session_state.get('current_mic_index', None),
-                            gain_multiplier=gain_multiplier
-                        )
+                    _session_audio_monitor().update_monitoring_gain(gain_multiplier)
                 
                 # 🎙️ 오디오 입력 소스 선택 (메인 화면으로 이동)
                 st.markdown("### 🎙️ 오디오 입력 소스")
                 
-                available_mics = st.session_state.generator.get_available_microphones()
+                # 마이크 목록/표시 이름/이름→인덱스는 새로고침할 때만 다시 만듦
+                mic_nonce = st.session_state.get('mic_nonce', 0)
+                if st.session_state.get('mic_cache_nonce') != mic_nonce or 'mic_cache' not in st.session_state:
+                    mics = get_microphones(generator, id(generator), mic_nonce)
+                    st.session_state.mic_cache = (
+                        mics,
+                        ["🎤 기본 마이크 (시스템 기본값)"] + [f"🎙️ {mic['name']}" for mic in mics],
+                        {mic['name']: i for i, mic in reversed(list(enumerate(mics)))}
+                    )
+                    st.session_state.mic_cache_nonce = mic_nonce
+                available_mics, mic_options, mic_index_by_name = st.session_state.mic_cache
+                
                 if available_mics:
                     # 마이크 정보 표시
                     st.info(f"📊 **{len(available_mics)}개**의 오디오 입력 장치를 발견했습니다")
                     
                     # 마이크 선택 드롭다운
-                    mic_options = ["🎤 기본 마이크 (시스템 기본값)"] + [f"🎙️ {mic['name']}" for mic in available_mics]
+                    current_mic_index = st.session_state.current_mic_index
                     selected_mic = st.selectbox(
                         "사용할 마이크를 선택하세요:",
                         mic_options,
+                        index=0 if current_mic_index is None or current_mic_index + 1 >= len(mic_options) else current_mic_index + 1,
                         help="마이크를 변경하면 볼륨 모니터링이 자동으로 재시작됩니다"
                     )
                     
@@ -425,23 +1139,20 @@ def main():
                         selected_mic_index = None
                         current_mic_name = "시스템 기본 마이크"
                     else:
-                        mic_name = selected_mic.replace("🎙️ ", "")
-                        selected_mic_index = next(
-                            (i for i, mic in enumerate(available_mics) 
-                             if mic['name'] == mic_name), None
-                        )
+                        mic_name = selected_mic.removeprefix("🎙️ ")
+                        selected_mic_index = mic_index_by_name.get(mic_name)
                         current_mic_name = mic_name
                     
                     # 세션 상태에 저장
-                    old_mic_index = st.session_state.get('current_mic_index', None)
+                    old_mic_index = st.session_state.current_mic_index
                     st.session_state.current_mic_index = selected_mic_index
                     
                     # 마이크 변경시 모니터링 재시작
                     if old_mic_index != selected_mic_index and st.session_state.audio_monitoring:
-                        st.session_state.generator.stop_audio_monitoring()
-                        st.session_state.generator.start_audio_monitoring(
+                        _session_audio_monitor().stop_audio_monitoring()
+                        _session_audio_monitor().start_audio_monitoring(
                             device_index=selected_mic_index,
-                            gain_multiplier=st.session_state.get('current_gain', 1.0)
+                            gain_multiplier=gain_multiplier
                         )
                         st.success(f"🔄 마이크가 '{current_mic_name}'로 변경되었습니다!")
                     
@@ -473,6 +1184,7 @@ def main():
                     4. 앱을 새로고침하여 다시 시도
                     """)
                     # 세션 상태에 저장
+                    selected_mic_index = None
                     st.session_state.current_mic_index = None
                 
                 # 고급 설정 (간소화)
@@ -482,9 +1194,9 @@ def main():
                     with col1:
                         if st.button("⚡ 빠른 레벨 체크", key="quick_level_check", use_container_width=True):
                             with st.spinner("오디오 레벨 확인 중..."):
-                                level_check = st.session_state.generator.get_audio_level_preview(
-                                    device_index=st.session_state.get('current_mic_index', None),
-                                    gain_multiplier=st.session_state.get('current_gain', 1.0),
+                                level_check = generator.get_audio_level_preview(
+                                    device_index=selected_mic_index,
+                                    gain_multiplier=gain_multiplier,
                                     duration=1.0
                                 )
                                 
@@ -495,16 +1207,14 @@ def main():
                                     clipping = level_check.get("clipping_detected", False)
                                     
                                     st.success("✅ 레벨 체크 완료!")
-                                    metric_col1, metric_col2 = st.columns(2)
-                                    with metric_col1:
-                                        st.metric("RMS 레벨", f"{rms*100:.1f}%")
-                                        st.metric("신호 품질", quality)
-                                    with metric_col2:
-                                        st.metric("피크 레벨", f"{peak*100:.1f}%")
-                                        if clipping:
-                                            st.error("⚠️ 클리핑 감지됨!")
-                                        else:
-                                            st.success("✅ 클리핑 없음")
+                                    # 수치 4개를 하나의 HTML 블록으로 표시
+                                    st.html(_LEVEL_CHECK_HTML.format(
+                                        rms=rms * 100,
+                                        peak=peak * 100,
+                                        quality=quality,
+                                        clip_color='red' if clipping else 'green',
+                                        clip_text='⚠️ 클리핑 감지됨!' if clipping else '✅ 클리핑 없음'
+                                    ))
                                 else:
                                     error_msg = level_check.get('error', '알 수 없는 오류')
                                     st.error(f"❌ 레벨 체크 실패: {error_msg}")
@@ -546,163 +1256,65 @@ def main():
                     
                     with col2:
                         if st.button("🔄 마이크 목록 새로고침", key="refresh_mics", use_container_width=True):
+                            st.session_state.mic_nonce = st.session_state.get('mic_nonce', 0) + 1
                             st.rerun()
                 
-                # 녹음 상태 초기화
-                if 'recording_state' not in st.session_state:
-                    st.session_state.recording_state = 'idle'  # idle, recording, processing
-                if 'recording_start_time' not in st.session_state:
-                    st.session_state.recording_start_time = None
-                if 'recording_process' not in st.session_state:
-                    st.session_state.recording_process = None
-                if 'recording_progress_data' not in st.session_state:
-                    st.session_state.recording_progress_data = None
-                
                 # 녹음 상태에 따른 UI
                 if st.session_state.recording_state == 'idle':
                     # 녹음 시작 버튼
                     if st.button("🔴 녹음 시작", key="start_recording_btn"):
+                        # 백그라운드 스레드에서 실제 녹음, 진행 상황은 최신 값 하나만 보관
+                        session_id = uuid.uuid4().hex[:8]
+                        recorded_path = str(TEMP_ROOT / f"recorded_voice_{session_id}.wav")
+                        progress_slot = deque(maxlen=1)
+                        stop_event = threading.Event()
+                        
+                        st.session_state.recording_process = {
+                            'future': _recording_pool().submit(
+                                _record_voice_session,
+                                generator,
+                                str(TEMP_ROOT / f"voice_samples_{session_id}"),
+                                duration=record_duration,
+                                output_path=recorded_path,
+                                gain_multiplier=gain_multiplier,
+                                device_index=selected_mic_index,
+                                progress_callback=progress_slot.append,
+                                stop_event=stop_event
+                            ),
+                            'progress': progress_slot,
+                            'stop_event': stop_event,
+                            'session_id': session_id,
+                            'recorded_path': recorded_path
+                        }
+                        st.session_state.recording_progress_data = None
                         st.session_state.recording_state = 'recording'
                         st.session_state.recording_start_time = time.time()
                         st.rerun()
                 
                 elif st.session_state.recording_state == 'recording':
-                    # 녹음 중 상태 표시
-                    elapsed_time = time.time() - st.session_state.recording_start_time
-                    remaining_time = max(0, record_duration - elapsed_time)
-                    
-                    # 진행 상황 표시
-                    progress = min(elapsed_time / record_duration, 1.0)
-                    
-                    # 녹음 상태 표시 박스
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(90deg, #ff4444, #ff6666);
-                        color: white;
-                        padding: 1rem;
-                        border-radius: 10px;
-                        text-align: center;
-                        margin: 1rem 0;
-                        animation: pulse 2s infinite;
-                    ">
-                        <h3>🔴 녹음 중... (게인: {gain_multiplier:.1f}x)</h3>
-                    </div>
-                    <style>
-                    @keyframes pulse {{
-                        0% {{ opacity: 1; }}
-                        50% {{ opacity: 0.7; }}
-                        100% {{ opacity: 1; }}
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
-                    
-                    # 향상된 진행률 표시
-                    progress_col1, progress_col2 = st.columns([3, 1])
-                    
-                    with progress_col1:
-                        st.progress(progress, text=f"진행률: {progress*100:.1f}% | {elapsed_time:.1f}s / {record_duration}s")
-                    
-                    with progress_col2:
-                        # 실시간 오디오 레벨 표시 (시뮬레이션)
-                        if st.session_state.recording_progress_data:
-                            audio_level = st.session_state.recording_progress_data.get('audio_level', 0)
-                            level_percentage = min(100, audio_level * 100)
-                            
-                            # 오디오 레벨 바
-                            level_color = "green" if level_percentage < 70 else "orange" if level_percentage < 90 else "red"
-                            st.markdown(f"""
-                            <div style="text-align: center;">
-                                <small>음성 레벨</small><br>
-                                <div style="
-                                    width: 100%;
-                                    height: 20px;
-                                    background: #ddd;
-                                    border-radius: 10px;
-                                    overflow: hidden;
-                                ">
-                                    <div style="
-                                        width: {level_percentage}%;
-                                        height: 100%;
-                                        background: {level_color};
-                                        transition: width 0.1s;
-                                    "></div>
-                                </div>
-                                <small>{level_percentage:.0f}%</small>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    
-                    # 상세 정보 표시
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("경과 시간", f"{elapsed_time:.1f}초")
-                    with col2:
-                        st.metric("남은 시간", f"{remaining_time:.1f}초")
-                    with col3:
-                        if st.session_state.recording_progress_data:
-                            gain_status = "🔊 정상" if gain_multiplier <= 2.0 else "⚠️ 높음"
-                            st.metric("게인 상태", gain_status)
-                    
-                    # 실시간 오디오 통계 (있는 경우)
-                    if st.session_state.recording_progress_data:
-                        with st.expander("📊 실시간 오디오 통계", expanded=False):
-                            data = st.session_state.recording_progress_data
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.write(f"**오디오 레벨:** {data.get('audio_level', 0):.3f}")
-                                st.write(f"**적용된 게인:** {data.get('gain', 1.0):.1f}x")
-                            with col2:
-                                st.write(f"**진행률:** {data.get('progress', 0)*100:.1f}%")
-                                if data.get('audio_level', 0) > 0.9:
-                                    st.warning("⚠️ 오디오 레벨이 높습니다!")
-                    
-                    # 정지 버튼 (크고 눈에 띄게)
-                    if st.button("⏹️ 녹음 정지", key="stop_recording_btn", type="secondary", use_container_width=True):
-                        st.session_state.recording_state = 'processing'
-                        st.rerun()
-                    
-                    # 자동 정지 (시간 초과)
-                    if elapsed_time >= record_duration:
-                        st.session_state.recording_state = 'processing'
-                        st.rerun()
-                    
-                    # 실시간 업데이트를 위한 자동 새로고침
-                    if remaining_time > 0:
-                        time.sleep(0.3)  # 0.3초마다 업데이트 (더 부드러운 UI)
-                        st.rerun()
+                    # 녹음 진행 표시는 프래그먼트만 주기적으로 다시 실행
+                    _recording_progress(record_duration, gain_multiplier)
                 
                 elif st.session_state.recording_state == 'processing':
                     # 녹음 처리 중
                     with st.spinner("녹음을 처리하고 음성 샘플을 생성하는 중..."):
-                        import uuid
-                        session_id = str(uuid.uuid4())[:8]
-                        recorded_path = os.path.join(Config.TEMP_DIR, f"recorded_voice_{session_id}.wav")
-                        
-                        # 실제 녹음 시간 계산
-                        actual_duration = min(time.time() - st.session_state.recording_start_time, record_duration)
+                        recording = st.session_state.recording_process
+                        session_id = recording['session_id']
+                        recorded_path = recording['recorded_path']
                         
-                        # 프로그레스 콜백 함수 정의
-                        def progress_callback(data):
-                            st.session_state.recording_progress_data = data
-                        
-                        # 음성 녹음 (게인 조정과 프로그레스 콜백 포함)
-                        record_result = st.session_state.generator.record_voice_from_microphone(
-                            duration=int(actual_duration),
-                            output_path=recorded_path,
-                            gain_multiplier=st.session_state.get('current_gain', 1.0),
-                            device_index=st.session_state.get('current_mic_index', None),
-                            progress_callback=progress_callback
-                        )
+                        # 백그라운드 녹음 + 샘플 생성 결과 (정지 버튼이면 조기 종료된 결과)
+                        try:
+                            record_result, samples_result = recording['future'].result()
+                        except Exception as e:
+                            record_result, samples_result = {"success": False, "error": str(e)}, None
+                        st.session_state.recording_process = None
+                        actual_duration = record_result.get('duration', 0)
                         
                         if record_result.get("success"):
                             st.success(f"✅ 녹음 완료! ({actual_duration:.1f}초)")
                             
-                            # 녹음에서 음성 샘플 생성
-                            samples_result = st.session_state.generator.tts_engine.create_voice_samples(
-                                recorded_path, 
-                                os.path.join(Config.TEMP_DIR, f"voice_samples_{session_id}")
-                            )
-                            
-                            if samples_result.get("success"):
+                            # 녹음에서 생성된 음성 샘플 (작업 스레드에서 이미 생성됨)
+                            if samples_result and samples_result.get("success"):
                                 # 녹음 결과 통계 표시
                                 col1, col2, col3 = st.columns(3)
                                 with col1:
@@ -733,6 +1345,7 @@ def main():
                                 # 세션 정보 저장
                                 st.session_state.voice_session_id = session_id
                                 st.session_state.voice_samples_dir = samples_result['output_dir']
+                                _scan_voice_sessions.clear()
                                 
                                 # 오디오 플레이어 추가
                                 if os.path.exists(recorded_path):
@@ -755,34 +1368,27 @@ def main():
                 st.markdown("### 🎭 음성 샘플 관리")
                 
                 # 현재 활성 세션 표시
-                if hasattr(st.session_state, 'voice_session_id'):
+                if st.session_state.voice_session_id:
                     st.success(f"✅ 활성 음성 세션: **{st.session_state.voice_session_id}**")
                     
                     # 음성 샘플 확인 및 재생
-                    if hasattr(st.session_state, 'voice_samples_dir') and os.path.exists(st.session_state.voice_samples_dir):
+                    if st.session_state.voice_samples_dir and os.path.exists(st.session_state.voice_samples_dir):
                         st.markdown("#### 🎵 생성된 음성 샘플")
                         
                         # 샘플 파일 목록 가져오기
-                        sample_files = []
-                        for filename in os.listdir(st.session_state.voice_samples_dir):
-                            if filename.endswith('.wav'):
-                                sample_path = os.path.join(st.session_state.voice_samples_dir, filename)
-                                if os.path.exists(sample_path):
-                                    # 파일 크기와 길이 정보
-                                    file_size = os.path.getsize(sample_path) / 1024  # KB
-                                    try:
-                                        import librosa
-                                        audio, sr = librosa.load(sample_path, sr=None)
-                                        duration = len(audio) / sr
-                                    except:
-                                        duration = 0
-                                    
-                                    sample_files.append({
-                                        'name': filename,
-                                        'path': sample_path,
-                                        'size': file_size,
-                                        'duration': duration
-                                    })
+                        with os.scandir(st.session_state.voice_samples_dir) as entries:
+                            wav_entries = [
+                                (entry.name, entry.path, entry.stat())
+                                for entry in entries
+                                if entry.name.endswith('.wav') and entry.is_file()
+                            ]
+                        
+                        # 파일 크기와 길이 정보 (헤더만 읽고 파일이 바뀔 때까지 캐시, 여러 파일을 병렬로 확인)
+                        metas = _wav_metas(wav_entries)
+                        sample_files = [
+                            {'name': name, 'path': path, **meta}
+                            for (name, path, _), meta in zip(wav_entries, metas)
+                        ]
                         
                         if sample_files:
                             # 샘플 정보 표시
@@ -816,9 +1422,14 @@ def main():
                             st.markdown("#### 📈 샘플 통계")
                             stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
                             
-                            total_duration = sum(s['duration'] for s in sample_files)
-                            total_size = sum(s['size'] for s in sample_files)
-                            good_samples = len([s for s in sample_files if 3.0 <= s['duration'] <= 10.0])
+                            # 한 번의 순회로 합계와 적정 길이(3~10초) 샘플 수 계산
+                            total_duration = total_size = 0
+                            good_samples = 0
+                            for s in sample_files:
+                                duration = s['duration']
+                                total_duration += duration
+                                total_size += s['size']
+                                good_samples += 3.0 <= duration <= 10.0
                             
                             with stat_col1:
                                 st.metric("총 샘플 수", len(sample_files))
@@ -843,19 +1454,15 @@ def main():
                     
                     with col2:
                         if st.button("🗑️ 음성 세션 삭제", key="clear_voice_session_btn", use_container_width=True):
-                            if hasattr(st.session_state, 'voice_samples_dir'):
-                                # 음성 샘플 정리
-                                try:
-                                    import shutil
-                                    shutil.rmtree(st.session_state.voice_samples_dir)
-                                    st.success("✅ 음성 샘플 폴더가 삭제되었습니다!")
-                                except Exception as e:
-                                    st.error(f"폴더 삭제 실패: {e}")
+                            if st.session_state.voice_samples_dir:
+                                # 음성 샘플 정리 (백그라운드)
+                                _remove_dir_async(st.session_state.voice_samples_dir)
+                                _scan_voice_sessions.clear()
                             
                             # 세션 변수 삭제
-                            delattr(st.session_state, 'voice_session_id')
-                            if hasattr(st.session_state, 'voice_samples_dir'):
-                                delattr(st.session_state, 'voice_samples_dir')
+                            st.session_state.voice_session_id = None
+                            st.session_state.voice_samples_dir = None
+                            st.session_state.pop('voice_extraction_result', None)
                             
                             st.success("🎭 음성 세션이 삭제되었습니다!")
                             st.rerun()
@@ -872,31 +1479,14 @@ def main():
                 with st.expander("🔧 고급: 모든 음성 세션 관리", expanded=False):
                     st.markdown("#### 📁 저장된 모든 음성 세션")
                     
-                    # temp 폴더에서 voice_samples_ 폴더들 찾기
-                    all_sessions = []
-                    if os.path.exists(Config.TEMP_DIR):
-                        for item in os.listdir(Config.TEMP_DIR):
-                            if item.startswith('voice_samples_') and os.path.isdir(os.path.join(Config.TEMP_DIR, item)):
-                                session_id = item.replace('voice_samples_', '')
-                                session_path = os.path.join(Config.TEMP_DIR, item)
-                                
-                                # 세션 정보 수집
-                                sample_count = len([f for f in os.listdir(session_path) if f.endswith('.wav')])
-                                folder_size = sum(os.path.getsize(os.path.join(session_path, f)) 
-                                                for f in os.listdir(session_path) if os.path.isfile(os.path.join(session_path, f)))
-                                
-                                all_sessions.append({
-                                    'id': session_id,
-                                    'path': session_path,
-                                    'samples': sample_count,
-                                    'size': folder_size / 1024  # KB
-                                })
+                    # temp 폴더에서 voice_samples_ 폴더들 찾기 (5초 캐시)
+                    all_sessions = _scan_voice_sessions(Config.TEMP_DIR)
                     
                     if all_sessions:
                         st.info(f"📊 총 **{len(all_sessions)}개**의 음성 세션을 발견했습니다")
                         
                         for session in all_sessions:
-                            is_active = hasattr(st.session_state, 'voice_session_id') and st.session_state.voice_session_id == session['id']
+                            is_active = st.session_state.voice_session_id == session['id']
                             status_icon = "🟢" if is_active else "⚪"
                             
                             col1, col2, col3 = st.columns([2, 1, 1])
@@ -913,30 +1503,24 @@ def main():
                             
                             with col3:
                                 if st.button("🗑️ 삭제", key=f"delete_{session['id']}", use_container_width=True):
-                                    try:
-                                        import shutil
-                                        shutil.rmtree(session['path'])
-                                        st.success(f"✅ 세션 {session['id']} 삭제 완료!")
-                                        st.rerun()
-                                    except Exception as e:
-                                        st.error(f"삭제 실패: {e}")
+                                    # 다른 세션이 먼저 지웠어도 목록만 갱신
+                                    _remove_dir_async(session['path'])
+                                    _scan_voice_sessions.clear()
+                                    st.success(f"✅ 세션 {session['id']} 삭제 완료!")
+                                    st.rerun()
                         
                         # 전체 정리 버튼
                         if st.button("🧹 모든 세션 정리", key="cleanup_all_sessions", type="secondary"):
                             deleted_count = 0
                             for session in all_sessions:
-                                try:
-                                    import shutil
-                                    shutil.rmtree(session['path'])
+                                if _remove_dir_async(session['path']):
                                     deleted_count += 1
-                                except:
-                                    pass
+                            _scan_voice_sessions.clear()
                             
                             # 활성 세션도 정리
-                            if hasattr(st.session_state, 'voice_session_id'):
-                                delattr(st.session_state, 'voice_session_id')
-                            if hasattr(st.session_state, 'voice_samples_dir'):
-                                delattr(st.session_state, 'voice_samples_dir')
+                            st.session_state.voice_session_id = None
+                            st.session_state.voice_samples_dir = None
+                            st.session_state.pop('voice_extraction_result', None)
                             
                             st.success(f"🧹 {deleted_count}개 세션이 정리되었습니다!")
                             st.rerun()
@@ -944,7 +1528,7 @@ def main():
                         st.write("저장된 음성 세션이 없습니다.")
         
         # 복제된 음성 사용 안내
-        if hasattr(st.session_state, 'voice_session_id') and voice_provider != "cloned":
+        if st.session_state.voice_session_id and voice_provider != "cloned":
             st.info("💡 복제된 음성을 사용할 수 있습니다! 음성 제공업체를 'cloned'로 설정하세요.")
         
         # 비디오 설정
@@ -976,10 +1560,15 @@ def main():
             if auto_cleanup:
                 cleanup_days = st.number_input("다음보다 오래된 파일 정리 (일)", min_value=1, max_value=30, value=7)
     
+    # 오래된 업로드 임시 폴더 정리 (세션당 한 번)
+    if auto_cleanup and not st.session_state.get('uploads_cleaned', False):
+        _cleanup_upload_dirs(cleanup_days)
+        st.session_state.uploads_cleaned = True
+    
     # Main content area with tabs
     if st.session_state.get('show_api_setup', False):
         # Show API setup page
-        render_api_key_setup()
+        _api_setup_ui()
         
         if st.button("⬅️ 메인으로 돌아가기"):
             st.session_state.show_api_setup = False
@@ -989,106 +1578,9 @@ def main():
         main_tab1, main_tab2, main_tab3, main_tab4 = st.tabs(["🎬 비디오 생성", "🎭 립싱크 비디오", "⚙️ API 키 설정", "📁 파일 관리"])
         
         with main_tab1:
-            # 비디오 생성 인터페이스
-            col1, col2 = st.columns([1, 1])
-            
-            with col1:
-                st.header("📸 이미지 업로드")
-                
-                uploaded_file = st.file_uploader(
-                    "이미지 파일을 선택하세요",
-                    type=['png', 'jpg', 'jpeg', 'bmp', 'tiff'],
-                    help="비디오에 사용할 인물 사진이나 이미지를 업로드하세요"
-                )
-        
-        if uploaded_file is not None:
-            # 업로드된 이미지 표시
-            image = Image.open(uploaded_file)
-            st.image(image, caption="업로드된 이미지", use_container_width=True)
-            
-            # Save uploaded file temporarily
-            temp_dir = tempfile.mkdtemp()
-            temp_image_path = os.path.join(temp_dir, uploaded_file.name)
-            
-            with open(temp_image_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            st.session_state.temp_image_path = temp_image_path
-            
-            # 배경음악 업로드
-            st.subheader("🎵 배경음악 (선택사항)")
-            music_file = st.file_uploader(
-                "배경음악을 선택하세요",
-                type=['mp3', 'wav', 'aac'],
-                help="비디오에 사용할 배경음악을 업로드하세요 (선택사항)"
-            )
-            
-            if music_file is not None:
-                temp_music_path = os.path.join(temp_dir, music_file.name)
-                with open(temp_music_path, "wb") as f:
-                    f.write(music_file.getbuffer())
-                st.session_state.temp_music_path = temp_music_path
-                st.success("🎵 배경음악이 업로드되었습니다!")
+            # 탭 안의 입력은 사이드바를 다시 그리지 않도록 프래그먼트로 분리
+            _video_generation_tab(voice_provider, duration, style, show_script, show_timing, enable_lipsync)
 
-            with col2:
-                st.header("📝 뉴스 주제")
-                
-                # 예시 주제들
-                with st.expander("💡 예시 주제들"):
-                    example_topics = [
-                        "손흥민 레알 마드리드 이적설",
-                        "의료 연구 분야 AI 혁신 기술 발표",
-                        "기후변화 정상회의 역사적 합의 도출",
-                        "대형 IT 기업 혁신적 스마트폰 발표",
-                        "올림픽 관중 동원 기록 경신",
-                        "화성 탐사 미션에서 물 발견"
-                    ]
-                    
-                    for i, topic in enumerate(example_topics):
-                        if st.button(f"📰 {topic}", key=f"example_topic_{i}"):
-                            st.session_state.news_topic = topic
-                
-                news_topic = st.text_area(
-                    "뉴스 제목이나 주제를 입력하세요:",
-                    value=st.session_state.get('news_topic', ''),
-                    height=100,
-                    placeholder="예: '속보: 손흥민 레알 마드리드 영입 확정'",
-                    help="비디오로 만들고 싶은 뉴스 주제를 입력하세요"
-                )
-                
-                # 생성 버튼
-                generate_button = st.button(
-                    "🚀 비디오 생성",
-                    type="primary",
-                    use_container_width=True,
-                    disabled=not (uploaded_file and news_topic.strip()),
-                    key="main_generate_btn"
-                )
-                
-                if generate_button:
-                    if not hasattr(st.session_state, 'temp_image_path'):
-                        st.error("먼저 이미지를 업로드해주세요!")
-                    elif not news_topic.strip():
-                        st.error("뉴스 주제를 입력해주세요!")
-                    else:
-                        # 복제된 음성 사용 시 음성 샘플 디렉토리 가져오기
-                        voice_samples_dir = None
-                        if voice_provider == "cloned" and hasattr(st.session_state, 'voice_samples_dir'):
-                            voice_samples_dir = st.session_state.voice_samples_dir
-                        
-                        generate_video(
-                            st.session_state.temp_image_path,
-                            news_topic,
-                            duration,
-                            style.lower(),
-                            voice_provider,
-                            st.session_state.get('temp_music_path', None),
-                            voice_samples_dir,
-                            show_script,
-                            show_timing,
-                            enable_lipsync
-                        )
-        
         with main_tab2:
             # 립싱크 비디오 생성 탭
             st.header("🎭 립싱크 비디오 생성")
@@ -1108,17 +1600,10 @@ def main():
                 
                 if face_image_file is not None:
                     # 업로드된 이미지 표시
-                    face_image = Image.open(face_image_file)
-                    st.image(face_image, caption="업로드된 얼굴 이미지", use_container_width=True)
-                    
-                    # Save uploaded file temporarily
-                    temp_dir = tempfile.mkdtemp()
-                    temp_face_path = os.path.join(temp_dir, face_image_file.name)
-                    
-                    with open(temp_face_path, "wb") as f:
-                        f.write(face_image_file.getbuffer())
+                    st.image(thumbnail(face_image_file.file_id, face_image_file), caption="업로드된 얼굴 이미지", use_container_width=True)
                     
-                    st.session_state.temp_face_path = temp_face_path
+                    # Save uploaded file temporarily (once per unique upload)
+                    _remember_upload('temp_face_path', face_image_file)
                     
                     # 배경 색상 선택
                     st.subheader("🎨 배경 설정")
@@ -1180,7 +1665,7 @@ def main():
                     if st.button("📝 스크립트 생성", key="generate_lipsync_script"):
                         if lipsync_news_topic.strip():
                             with st.spinner("AI가 스크립트를 생성하는 중..."):
-                                lipsync_script = st.session_state.generator.script_generator.generate_news_script(
+                                lipsync_script = generator.script_generator.generate_news_script(
                                     topic=lipsync_news_topic,
                                     duration_seconds=script_duration,
                                     style="modern"
@@ -1195,7 +1680,7 @@ def main():
                             st.error("뉴스 주제를 입력해주세요!")
                     
                     # 생성된 스크립트 표시
-                    if hasattr(st.session_state, 'generated_lipsync_script'):
+                    if 'generated_lipsync_script' in st.session_state:
                         lipsync_script = st.text_area(
                             "생성된 스크립트 (수정 가능):",
                             value=st.session_state.generated_lipsync_script,
@@ -1209,20 +1694,20 @@ def main():
                 st.subheader("🎤 음성 설정")
                 lipsync_voice_provider = st.selectbox(
                     "음성 제공업체",
-                    options=voice_info['providers'],
+                    options=voice_providers,
                     index=0,
                     help="립싱크 비디오에 사용할 음성을 선택하세요",
                     key="lipsync_voice_provider"
                 )
                 
                 # 복제된 음성 사용 안내
-                if lipsync_voice_provider == "cloned" and hasattr(st.session_state, 'voice_session_id'):
+                if lipsync_voice_provider == "cloned" and st.session_state.voice_session_id:
                     st.info(f"🎭 복제된 음성 사용 (세션: {st.session_state.voice_session_id[:8]})")
                 elif lipsync_voice_provider == "cloned":
                     st.warning("⚠️ 복제된 음성을 사용하려면 먼저 사이드바에서 음성을 복제해주세요.")
                 
                 # 립싱크 비디오 생성 버튼
-                if hasattr(st.session_state, 'temp_face_path') and lipsync_script.strip():
+                if st.session_state.temp_face_path and lipsync_script.strip():
                     generate_lipsync_button = st.button(
                         "🎭 립싱크 비디오 생성",
                         type="primary",
@@ -1233,7 +1718,7 @@ def main():
                     if generate_lipsync_button:
                         # 복제된 음성 사용 시 음성 샘플 디렉토리 가져오기
                         lipsync_voice_samples_dir = None
-                        if lipsync_voice_provider == "cloned" and hasattr(st.session_state, 'voice_samples_dir'):
+                        if lipsync_voice_provider == "cloned" and st.session_state.voice_samples_dir:
                             lipsync_voice_samples_dir = st.session_state.voice_samples_dir
                         
                         generate_lipsync_video(
@@ -1246,10 +1731,13 @@ def main():
                         )
                 else:
                     st.info("💡 얼굴 이미지와 스크립트를 모두 준비하면 립싱크 비디오를 생성할 수 있습니다.")
+                
+                # 립싱크 작업 상태 / 결과
+                show_video_job('active_lipsync_job_id')
         
         with main_tab3:
             # API Key setup tab
-            render_api_key_setup()
+            _api_setup_ui()
         
         with main_tab4:
             # File management tab
@@ -1261,35 +1749,25 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 2rem;">
-        <p>🎬 AutoAvatar - AI 뉴스 비디오 생성기</p>
-        <p>❤️ Streamlit, OpenAI, MoviePy로 제작</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+
 
 def generate_lipsync_video(face_image_path, script_text, voice_provider, voice_samples_dir, background_color, add_subtitles):
-    """Generate lip-sync video with progress tracking"""
-    
-    # Progress bar and status
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Start generation
-    status_text.text("🎭 립싱크 비디오 생성 중...")
-    progress_bar.progress(10)
-    
-    with st.spinner("립싱크 비디오를 생성하는 중..."):
-        result = st.session_state.generator.generate_lipsync_video(
-            face_image_path=face_image_path,
-            script_text=script_text,
-            voice_provider=voice_provider,
-            voice_samples_dir=voice_samples_dir,
-            background_color=background_color,
-            add_subtitles=add_subtitles
-        )
-    
-    progress_bar.progress(100)
+    """Submit lip-sync video generation as a background job"""
+    _submit_job(
+        'active_lipsync_job_id',
+        functools.partial(show_lipsync_result, add_subtitles=add_subtitles),
+        _current_generator().generate_lipsync_video,
+        face_image_path=face_image_path,
+        script_text=script_text,
+        voice_provider=voice_provider,
+        voice_samples_dir=voice_samples_dir,
+        background_color=background_color,
+        add_subtitles=add_subtitles
+    )
+
+def show_lipsync_result(result, add_subtitles):
+    """Display a finished lip-sync generation result"""
     
     if result['success']:
         st.success("🎉 립싱크 비디오가 성공적으로 생성되었습니다!")
@@ -1298,22 +1776,16 @@ def generate_lipsync_video(face_image_path, script_text, voice_provider, voice_s
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            # Video player
-            video_file = open(result['video_path'], 'rb')
-            video_bytes = video_file.read()
-            st.video(video_bytes)
-            
-            # Download button
-            st.download_button(
-                label="📥 립싱크 비디오 다운로드",
-                data=video_bytes,
-                file_name=f"lipsync_video_{int(time.time())}.mp4",
-                mime="video/mp4"
+            # Video player + download button
+            _render_video(
+                result['video_path'],
+                "📥 립싱크 비디오 다운로드",
+                Path(result['video_path']).name
             )
         
         with col2:
             # Video info
-            video_info = st.session_state.generator.get_video_info(result['video_path'])
+            video_info = _current_generator().get_video_info(result['video_path'])
             
             st.markdown('<div class="info-box">', unsafe_allow_html=True)
             st.write("**🎭 립싱크 비디오 정보:**")
@@ -1350,30 +1822,70 @@ def generate_lipsync_video(face_image_path, script_text, voice_provider, voice_s
                - 이미지 크기를 줄여서 다시 시도
             """)
 
+def _submit_job(active_key, render, fn, **kwargs):
+    """Queue fn on the shared generation pool and make it the job shown under active_key"""
+    # 끝난 작업은 정리하되 다른 화면에 결과가 표시 중인 작업은 유지
+    shown = {st.session_state.get(key) for key in ('active_job_id', 'active_lipsync_job_id')}
+    jobs = {
+        job_id: job for job_id, job in st.session_state.jobs.items()
+        if not job['future'].done() or job_id in shown
+    }
+    
+    job_id = uuid.uuid4().hex[:8]
+    jobs[job_id] = {
+        'future': _generation_pool().submit(fn, **kwargs),
+        'started_at': time.time(),
+        'render': render
+    }
+    st.session_state.jobs = jobs
+    st.session_state[active_key] = job_id
+
 def generate_video(image_path, news_topic, duration, style, voice_provider, music_path, voice_samples_dir, show_script, show_timing, enable_lipsync=False):
-    """Generate video with progress tracking"""
-    
-    # Progress bar and status
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Start generation
-    status_text.text("🤖 Generating news script...")
-    progress_bar.progress(10)
-    
-    with st.spinner("Creating your video..."):
-        result = st.session_state.generator.generate_video(
-            image_path=image_path,
-            news_topic=news_topic,
-            duration=duration,
-            style=style,
-            voice_provider=voice_provider,
-            background_music_path=music_path,
-            voice_samples_dir=voice_samples_dir,
-            enable_lipsync=enable_lipsync
-        )
+    """Submit video generation as a background job"""
+    _submit_job(
+        'active_job_id',
+        functools.partial(show_video_result, show_script=show_script, show_timing=show_timing),
+        _current_generator().generate_video,
+        image_path=image_path,
+        news_topic=news_topic,
+        duration=duration,
+        style=style,
+        voice_provider=voice_provider,
+        background_music_path=music_path,
+        voice_samples_dir=voice_samples_dir,
+        enable_lipsync=enable_lipsync
+    )
+
+@st.fragment(run_every=1)
+def _video_job_progress(job):
+    """Rendering status line, reruns on its own until the job finishes"""
+    # 작업이 끝나면 전체 페이지를 다시 그려 결과를 표시
+    if job['future'].done():
+        st.rerun()
     
-    progress_bar.progress(100)
+    elapsed = time.time() - job['started_at']
+    st.info(f"🎬 Rendering your video... ({elapsed:.0f}s)")
+
+def show_video_job(active_key='active_job_id'):
+    """Show status or result of the job referenced by active_key"""
+    job = st.session_state.jobs.get(st.session_state.get(active_key))
+    if job is None:
+        return
+    
+    future = job['future']
+    if not future.done():
+        _video_job_progress(job)
+        return
+    
+    try:
+        result = future.result()
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+    
+    job['render'](result)
+
+def show_video_result(result, show_script, show_timing):
+    """Display a finished video generation result"""
     
     if result['success']:
         st.success("🎉 Video generated successfully!")
@@ -1382,22 +1894,16 @@ def generate_video(image_path, news_topic, duration, style, voice_provider, musi
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            # Video player
-            video_file = open(result['video_path'], 'rb')
-            video_bytes = video_file.read()
-            st.video(video_bytes)
-            
-            # Download button
-            st.download_button(
-                label="📥 Download Video",
-                data=video_bytes,
-                file_name=f"news_video_{int(time.time())}.mp4",
-                mime="video/mp4"
+            # Video player + download button
+            _render_video(
+                result['video_path'],
+                "📥 Download Video",
+                Path(result['video_path']).name
             )
         
         with col2:
             # Video info
-            video_info = st.session_state.generator.get_video_info(result['video_path'])
+            video_info = _current_generator().get_video_info(result['video_path'])
             
             st.markdown('<div class="info-box">', unsafe_allow_html=True)
             st.write("**📊 Video Information:**")
@@ -1423,43 +1929,39 @@ def generate_video(image_path, news_topic, duration, style, voice_provider, musi
     
     else:
         st.markdown(f'<div class="error-box">❌ Error: {result["error"]}</div>', unsafe_allow_html=True)
-    
-    status_text.empty()
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _count_mp4s(directory):
+    """Count rendered .mp4 files in a directory"""
+    with os.scandir(directory) as entries:
+        return sum(1 for e in entries if e.is_file() and e.name.endswith('.mp4'))
 
 # Additional features section
+@st.fragment
 def show_additional_features():
     st.header("🔧 Additional Features")
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown('<div class="feature-box">', unsafe_allow_html=True)
-        st.subheader("🎨 Styles Available")
-        st.write("• **Modern**: Clean gradients, subtle animations")
-        st.write("• **Classic**: Professional, traditional news look")
-        st.write("• **Dramatic**: Bold colors, dynamic effects")
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(_FEATURES_HTML_1, unsafe_allow_html=True)
     
     with col2:
-        st.markdown('<div class="feature-box">', unsafe_allow_html=True)
-        st.subheader("🗣️ Voice Options")
-        st.write("• **Voice Cloning**: Extract from video/audio files")
-        st.write("• **Microphone Recording**: Record your own voice")
-        st.write("• **ElevenLabs**: Premium AI voices")
-        st.write("• **Azure**: Microsoft's speech service")
-        st.write("• **Basic**: Fallback TTS option")
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(_FEATURES_HTML_2, unsafe_allow_html=True)
     
     with col3:
-        st.markdown('<div class="feature-box">', unsafe_allow_html=True)
-        st.subheader("⚡ Quick Features")
-        st.write("• Auto script generation")
-        st.write("• Dynamic subtitles")
-        st.write("• Background music mixing")
-        st.write("• Multiple export formats")
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(_FEATURES_HTML_3, unsafe_allow_html=True)
+
+@st.fragment(run_every=0.5)
+def _cleanup_progress(future):
+    """Cleanup status line, reruns on its own until the cleanup finishes"""
+    # 끝나면 한 번 다시 그려 결과를 표시 (대기 중 sleep 없음)
+    if future.done():
+        st.rerun()
+    st.info("🧹 오래된 파일을 정리하는 중...")
 
 # File management section
+@st.fragment
 def show_file_management():
     st.markdown("### 📁 파일 관리")
     
@@ -1467,21 +1969,29 @@ def show_file_management():
     
     with col1:
         if st.button("🧹 오래된 파일 정리", key="cleanup_files_btn"):
-            if 'generator' in st.session_state:
-                cleaned = st.session_state.generator.cleanup_old_files()
+            st.session_state.cleanup_future = _io_pool().submit(
+                _current_generator().cleanup_old_files
+            )
+        
+        # 백그라운드 정리 결과
+        cleanup_future = st.session_state.get('cleanup_future')
+        if cleanup_future is not None:
+            if not cleanup_future.done():
+                _cleanup_progress(cleanup_future)
+            else:
+                del st.session_state.cleanup_future
+                _count_mp4s.clear()
+                cleaned = cleanup_future.result()
                 if cleaned:
                     st.success(f"{len(cleaned)}개의 오래된 파일을 정리했습니다")
                 else:
                     st.info("정리할 오래된 파일이 없습니다")
-            else:
-                st.warning("비디오 생성기가 초기화되지 않았습니다")
     
     with col2:
         # 출력 디렉토리 내용 표시
         output_dir = Config.OUTPUT_DIR
         if os.path.exists(output_dir):
-            files = [f for f in os.listdir(output_dir) if f.endswith('.mp4')]
-            st.write(f"**출력 폴더의 비디오:** {len(files)}개")
+            st.write(f"**출력 폴더의 비디오:** {_count_mp4s(output_dir)}개")
         else:
             st.write("**출력 폴더:** 아직 생성되지 않음")
 
@@ -2,7 +2,6 @@ import streamlit as st
 import os
 import tempfile
 import time
-from PIL import Image
 
 # 선택적 import - Cloud 환경에서 안전하게 처리
 try:
@@ -26,6 +25,8 @@ except ImportError:
     def render_api_key_setup():
         st.info("API 키 설정 UI를 불러올 수 없습니다. Streamlit Secrets를 사용하세요.")
 
+from utils.ui_helpers import thumbnail, example_topic_pills
+
 # 페이지 설정
 st.set_page_config(
     page_title="AutoAvatar - AI 뉴스 비디오 생성기",
@@ -35,7 +36,7 @@ st.set_page_config(
 )
 
 # CSS 스타일
-st.markdown("""
+_CSS_BLOCK = """
 <style>
 .main-header {
     background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -71,21 +72,36 @@ st.markdown("""
     color: #c62828;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🎬 AutoAvatar</h1>
+    <h3>AI 뉴스 비디오 생성기 (Cloud Edition)</h3>
+    <p>이미지와 뉴스 주제로 전문적인 비디오를 자동 생성합니다</p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 2rem;">
+    <p>🎬 AutoAvatar - AI 뉴스 비디오 생성기 (Cloud Edition)</p>
+    <p>❤️ Streamlit, OpenAI로 제작</p>
+</div>
+"""
+
+st.html(_CSS_BLOCK)
+
+@st.cache_resource(show_spinner=False)
+def get_script_generator(openai_key):
+    """Shared ScriptGenerator, rebuilt only when the OpenAI key changes"""
+    return ScriptGenerator()
 
 def main():
     # 헤더
-    st.markdown("""
-    <div class="main-header">
-        <h1>🎬 AutoAvatar</h1>
-        <h3>AI 뉴스 비디오 생성기 (Cloud Edition)</h3>
-        <p>이미지와 뉴스 주제로 전문적인 비디오를 자동 생성합니다</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
-    # 초기화
-    if 'script_generator' not in st.session_state:
-        st.session_state.script_generator = ScriptGenerator()
+    # 초기화 (세션 간 공유)
+    script_generator = get_script_generator(Config.OPENAI_API_KEY)
     
     # 사이드바 설정
     with st.sidebar:
@@ -150,8 +166,7 @@ def main():
                 
                 if uploaded_file is not None:
                     # 업로드된 이미지 표시
-                    image = Image.open(uploaded_file)
-                    st.image(image, caption="업로드된 이미지", use_container_width=True)
+                    st.image(thumbnail(uploaded_file.file_id, uploaded_file), caption="업로드된 이미지", use_container_width=True)
             
             with col2:
                 st.header("📝 뉴스 주제")
@@ -167,9 +182,7 @@ def main():
                         "화성 탐사 미션에서 물 발견"
                     ]
                     
-                    for i, topic in enumerate(example_topics):
-                        if st.button(f"📰 {topic}", key=f"example_topic_{i}"):
-                            st.session_state.news_topic = topic
+                    example_topic_pills(example_topics, "news_topic")
                 
                 news_topic = st.text_area(
                     "뉴스 제목이나 주제를 입력하세요:",
@@ -192,13 +205,13 @@ def main():
                     if not news_topic.strip():
                         st.error("뉴스 주제를 입력해주세요!")
                     else:
-                        generate_script(news_topic, duration, style)
+                        generate_script(script_generator, news_topic, duration, style)
         
         with main_tab2:
             # API Key setup tab
             render_api_key_setup()
 
-def generate_script(news_topic, duration, style):
+def generate_script(script_generator, news_topic, duration, style):
     """스크립트 생성"""
     
     # Progress bar and status
@@ -211,7 +224,7 @@ def generate_script(news_topic, duration, style):
     
     try:
         # 스크립트 생성
-        script = st.session_state.script_generator.generate_news_script(
+        script = script_generator.generate_news_script(
             topic=news_topic,
             duration_seconds=duration,
             style=style.lower()
@@ -232,7 +245,7 @@ def generate_script(news_topic, duration, style):
             )
             
             # 타이밍 분석
-            timing_info = st.session_state.script_generator.analyze_script_timing(script)
+            timing_info = script_generator.analyze_script_timing(script)
             
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -275,9 +288,4 @@ if __name__ == "__main__":
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 2rem;">
-        <p>🎬 AutoAvatar - AI 뉴스 비디오 생성기 (Cloud Edition)</p>
-        <p>❤️ Streamlit, OpenAI로 제작</p>
-    </div>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True) 
\ No newline at end of file
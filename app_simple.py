@@ -1,7 +1,9 @@
 import streamlit as st
-import openai
 import os
-from PIL import Image
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.ui_helpers import thumbnail, example_topic_pills
 
 # 페이지 설정
 st.set_page_config(
@@ -11,7 +13,7 @@ st.set_page_config(
 )
 
 # CSS 스타일
-st.markdown("""
+_CSS_BLOCK = """
 <style>
 .main-header {
     background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -22,7 +24,24 @@ st.markdown("""
     margin-bottom: 2rem;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🎬 AutoAvatar</h1>
+    <h3>AI 뉴스 스크립트 생성기 (Cloud Edition)</h3>
+    <p>뉴스 주제를 입력하면 전문적인 스크립트를 자동 생성합니다</p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 1rem;">
+    <p>🎬 AutoAvatar - AI 뉴스 스크립트 생성기</p>
+    <p>❤️ Made with Streamlit & OpenAI</p>
+</div>
+"""
+
+st.html(_CSS_BLOCK)
 
 def get_openai_key():
     """OpenAI API 키 가져오기"""
@@ -52,7 +71,57 @@ def generate_news_script(topic, duration, style):
         st.info("위의 'API 키 입력' 섹션에서 키를 입력해주세요.")
         return None
     
-    # OpenAI 클라이언트 초기화
+    # 1시간 안에 같은 요청이면 캐시에서 바로 반환 (조회는 스크립트 스레드에서)
+    cache_key = (topic, duration, style, api_key)
+    cache = _script_cache()
+    cached = cache.get(cache_key)
+    if cached and time.time() - cached[0] < SCRIPT_CACHE_TTL:
+        return cached[1]
+    
+    # 작업 스레드가 스트리밍으로 받은 조각을 여기서 바로 표시
+    parts = []
+    future = _script_pool().submit(_request_news_script, topic, duration, style, api_key, parts)
+    progress_bar = st.progress(0, text="🤖 스크립트 생성 중...")
+    preview = st.empty()
+    while not future.done():
+        # 조각 수 ≈ 토큰 수 (max_tokens=1000 기준)
+        progress_bar.progress(min(95, len(parts) // 10), text="🤖 스크립트 생성 중...")
+        if parts:
+            preview.markdown("".join(parts))
+        time.sleep(0.2)
+    progress_bar.empty()
+    preview.empty()
+    
+    try:
+        script = future.result()
+    except Exception as e:
+        # 실패한 요청은 캐시하지 않음
+        st.error(f"❌ 스크립트 생성 오류: {str(e)}")
+        return None
+    
+    if len(cache) >= SCRIPT_CACHE_MAX_ENTRIES:
+        cache.clear()
+    cache[cache_key] = (time.time(), script)
+    return script
+
+@st.cache_resource
+def _script_pool():
+    """Worker pool shared across sessions for OpenAI requests"""
+    return ThreadPoolExecutor(max_workers=4)
+
+# 같은 요청의 스크립트를 재사용하는 시간(초)과 최대 개수
+SCRIPT_CACHE_TTL = 3600
+SCRIPT_CACHE_MAX_ENTRIES = 64
+
+@st.cache_resource
+def _script_cache():
+    """Generated scripts shared across sessions: (topic, duration, style, key) -> (time, script)"""
+    return {}
+
+def _request_news_script(topic, duration, style, api_key, parts):
+    """Stream a GPT-4 news script into parts (runs on a worker thread, no st calls)"""
+    import openai
+    
     client = openai.OpenAI(api_key=api_key)
     
     # 프롬프트 생성
@@ -73,32 +142,25 @@ def generate_news_script(topic, duration, style):
     스크립트만 출력하고 다른 설명은 포함하지 마세요.
     """
     
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "당신은 전문 뉴스 스크립트 작가입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1000,
-            temperature=0.7
-        )
-        
-        return response.choices[0].message.content.strip()
+    response = client.chat.completions.create(
+        model="gpt-4",
+        messages=[
+            {"role": "system", "content": "당신은 전문 뉴스 스크립트 작가입니다."},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=1000,
+        temperature=0.7,
+        stream=True
+    )
     
-    except Exception as e:
-        st.error(f"❌ 스크립트 생성 오류: {str(e)}")
-        return None
+    for chunk in response:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+    return "".join(parts).strip()
 
 def main():
     # 헤더
-    st.markdown("""
-    <div class="main-header">
-        <h1>🎬 AutoAvatar</h1>
-        <h3>AI 뉴스 스크립트 생성기 (Cloud Edition)</h3>
-        <p>뉴스 주제를 입력하면 전문적인 스크립트를 자동 생성합니다</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # API 키 상태 확인 및 입력
     api_key = get_openai_key()
@@ -149,8 +211,7 @@ def main():
         )
         
         if uploaded_file is not None:
-            image = Image.open(uploaded_file)
-            st.image(image, caption="업로드된 이미지", use_container_width=True)
+            st.image(thumbnail(uploaded_file.file_id, uploaded_file), caption="업로드된 이미지", use_container_width=True)
     
     with col2:
         st.header("📝 뉴스 주제")
@@ -163,9 +224,7 @@ def main():
                 "기후변화 대응 국제 협력",
                 "새로운 스마트폰 기술 발표"
             ]
-            for i, example in enumerate(examples):
-                if st.button(f"📰 {example}", key=f"ex_{i}"):
-                    st.session_state.topic = example
+            example_topic_pills(examples, "topic")
         
         # 주제 입력
         topic = st.text_area(
@@ -222,9 +281,4 @@ if __name__ == "__main__":
     
     # 푸터
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 1rem;">
-        <p>🎬 AutoAvatar - AI 뉴스 스크립트 생성기</p>
-        <p>❤️ Made with Streamlit & OpenAI</p>
-    </div>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True) 
\ No newline at end of file
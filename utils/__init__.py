@@ -5,11 +5,25 @@ Core utilities for automated video generation:
 - Script generation using AI
 - Text-to-speech synthesis
 - Video composition and effects
+
+The heavy classes are imported lazily so that light modules such as
+utils.config_manager can be used without loading torch/whisper/MoviePy.
 """
 
-from .script_generator import ScriptGenerator
-from .tts_engine import TTSEngine
-from .video_composer import VideoComposer
-from .voice_cloner import VoiceCloner
+import importlib
+
+_LAZY_EXPORTS = {
+    'ScriptGenerator': '.script_generator',
+    'TTSEngine': '.tts_engine',
+    'VideoComposer': '.video_composer',
+    'VoiceCloner': '.voice_cloner',
+}
+
+__all__ = ['ScriptGenerator', 'TTSEngine', 'VideoComposer', 'VoiceCloner']
+
 
-__all__ = ['ScriptGenerator', 'TTSEngine', 'VideoComposer', 'VoiceCloner'] 
\ No newline at end of file
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
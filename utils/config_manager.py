@@ -1,6 +1,7 @@
 import os
 import json
 import streamlit as st
+from functools import lru_cache
 from typing import Dict, Optional
 from pathlib import Path
 
@@ -58,21 +59,25 @@ class ConfigManager:
     
     def validate_api_keys(self) -> Dict[str, bool]:
         """API 키 유효성 검증"""
-        validation_results = {}
-        
-        # OpenAI 키 검증
-        openai_key = self.get_api_key('openai')
-        validation_results['openai'] = bool(openai_key and openai_key.startswith('sk-'))
-        
-        # ElevenLabs 키 검증
-        elevenlabs_key = self.get_api_key('elevenlabs')
-        validation_results['elevenlabs'] = bool(elevenlabs_key and len(elevenlabs_key) > 10)
-        
-        # Azure 키 검증
-        azure_key = self.get_api_key('azure_speech')
-        validation_results['azure'] = bool(azure_key and len(azure_key) > 10)
-        
-        return validation_results
+        # 키 값이 바뀌지 않았으면 이전 검증 결과 재사용
+        return dict(self._validate_keys(
+            self.get_api_key('openai'),
+            self.get_api_key('elevenlabs'),
+            self.get_api_key('azure_speech')
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _validate_keys(openai_key, elevenlabs_key, azure_key):
+        """키 값 조합별 검증 결과 (불변 튜플로 캐시)"""
+        return (
+            # OpenAI 키 검증
+            ('openai', bool(openai_key and openai_key.startswith('sk-'))),
+            # ElevenLabs 키 검증
+            ('elevenlabs', bool(elevenlabs_key and len(elevenlabs_key) > 10)),
+            # Azure 키 검증
+            ('azure', bool(azure_key and len(azure_key) > 10)),
+        )
     
     def get_service_info(self) -> Dict[str, Dict]:
         """각 서비스 정보 반환"""
@@ -1,5 +1,6 @@
 import os
 import tempfile
+import threading
 from typing import Optional, Union, Dict, List
 import requests
 try:
@@ -21,7 +22,7 @@ except ImportError:
         set_api_key = None
 from pydub import AudioSegment
 from config import Config
-from .voice_cloner import VoiceCloner
+from .voice_cloner import VoiceCloner, AudioLevel
 
 class TTSEngine:
     def __init__(self):
@@ -215,14 +216,16 @@ class TTSEngine:
     def record_voice_from_microphone(self, duration: int, output_path: str, 
                                    gain_multiplier: float = 1.0,
                                    device_index: Optional[int] = None,
-                                   progress_callback: Optional[callable] = None) -> Dict:
+                                   progress_callback: Optional[callable] = None,
+                                   stop_event: Optional[threading.Event] = None) -> Dict:
         """Record voice from microphone with gain control"""
         return self.voice_cloner.record_voice_from_microphone(
             duration=duration,
             output_path=output_path,
             gain_multiplier=gain_multiplier,
             device_index=device_index,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            stop_event=stop_event
         )
     
     def create_voice_samples(self, audio_path: str, output_dir: str) -> Dict:
@@ -261,7 +264,11 @@ class TTSEngine:
         """Stop audio monitoring"""
         return self.voice_cloner.stop_audio_monitoring()
     
-    def get_current_audio_level(self) -> Dict:
+    def update_monitoring_gain(self, gain_multiplier: float) -> None:
+        """Change the monitoring gain without restarting the stream"""
+        self.voice_cloner.update_monitoring_gain(gain_multiplier)
+    
+    def get_current_audio_level(self) -> AudioLevel:
         """Get current audio level from monitoring thread"""
         return self.voice_cloner.get_current_audio_level()
     
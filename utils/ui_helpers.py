@@ -0,0 +1,32 @@
+import io
+
+import streamlit as st
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def thumbnail(file_id, _upload, max_side=800):
+    """Downscaled JPEG preview of an uploaded image, decoded once per upload"""
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(_upload.getvalue()))
+    img.thumbnail((max_side, max_side))
+    buf = io.BytesIO()
+    img.convert("RGB").save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+def _apply_example_topic(target_key):
+    """Copy the selected example topic into the topic field"""
+    if st.session_state.example_topic_pill:
+        st.session_state[target_key] = st.session_state.example_topic_pill
+
+def example_topic_pills(topics, target_key):
+    """Example topic pills that copy the picked topic into target_key"""
+    st.pills(
+        "예시 주제",
+        topics,
+        selection_mode="single",
+        key="example_topic_pill",
+        on_change=_apply_example_topic,
+        args=(target_key,),
+        label_visibility="collapsed"
+    )
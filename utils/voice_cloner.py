@@ -1,4 +1,5 @@
 import os
+import math
 import tempfile
 import numpy as np
 from typing import Optional, Dict, List, Tuple
@@ -27,8 +28,170 @@ except ImportError:
 import wave
 import threading
 import time
+from collections import namedtuple
 from config import Config
 
+# Normalized (0-1) monitoring level snapshot returned to the UI
+AudioLevel = namedtuple('AudioLevel', 'rms_level peak_level gain clipping timestamp')
+
+
+class AudioMonitor:
+    """Microphone level monitor; keep one per UI session so sessions never share a stream"""
+    def __init__(self):
+        self.monitoring_active = False
+        self.monitoring_thread = None
+        # Latest (rms, peak, timestamp) in raw int16 units; the monitor thread
+        # overwrites this single slot so stale levels are dropped, never queued
+        self.raw_audio_level = (0.0, 0.0, 0.0)
+        self.monitor_gain = 1.0
+    
+    def start_audio_monitoring(self, device_index: Optional[int] = None, 
+                             gain_multiplier: float = 1.0) -> Dict:
+        """
+        Start real-time audio level monitoring
+        
+        Args:
+            device_index: Microphone device index
+            gain_multiplier: Audio gain multiplier
+            
+        Returns:
+            Dictionary with monitoring status
+        """
+        if not PYAUDIO_AVAILABLE:
+            return {"success": False, "error": "PyAudio not available. Cannot start audio monitoring."}
+        
+        try:
+            # Initialize PyAudio first to check device capabilities
+            p = pyaudio.PyAudio()
+            
+            # Get device info if device_index is specified
+            if device_index is not None:
+                try:
+                    device_info = p.get_device_info_by_index(device_index)
+                    max_channels = int(device_info.get('maxInputChannels', 1))
+                    default_rate = int(device_info.get('defaultSampleRate', 44100))
+                except:
+                    # Fallback if device info fails
+                    max_channels = 1
+                    default_rate = 44100
+            else:
+                max_channels = 1
+                default_rate = 44100
+            
+            # Safe audio parameters with fallbacks
+            chunk = 1024
+            format = pyaudio.paInt16
+            channels = min(1, max_channels)  # Use 1 channel (mono) for safety
+            
+            # Try different sample rates in order of preference
+            rate_options = [default_rate, 44100, 48000, 22050, 16000]
+            rate = 44100  # Default fallback
+            
+            stream = None
+            last_error = None
+            for test_rate in rate_options:
+                try:
+                    # Test stream creation with current parameters
+                    test_stream = p.open(
+                        format=format,
+                        channels=channels,
+                        rate=int(test_rate),
+                        input=True,
+                        input_device_index=device_index,
+                        frames_per_buffer=chunk
+                    )
+                    # If successful, use these parameters
+                    rate = int(test_rate)
+                    stream = test_stream
+                    break
+                except Exception as e:
+                    # Continue trying other rates
+                    last_error = str(e)
+                    continue
+            
+            if stream is None:
+                p.terminate()
+                error_detail = f"Cannot open audio stream with any supported parameters. Last error: {last_error}" if last_error else "Cannot open audio stream with any supported parameters"
+                return {"success": False, "error": error_detail}
+            
+            self.monitoring_active = True
+            self.monitor_gain = gain_multiplier
+            
+            def monitor_audio():
+                """Audio monitoring thread function"""
+                try:
+                    while self.monitoring_active:
+                        # Read audio data
+                        data = stream.read(chunk, exception_on_overflow=False)
+                        
+                        # Zero-copy view (gain is linear, so it is applied on read)
+                        samples = np.frombuffer(data, dtype=np.int16)
+                        
+                        # RMS envelope from every 4th sample is plenty for a meter;
+                        # peak still scans every sample so clipping is not missed
+                        decimated = samples[::4].astype(np.int64)
+                        rms = math.sqrt(int(np.dot(decimated, decimated)) / decimated.size)
+                        peak = float(max(-int(samples.min()), int(samples.max())))
+                        
+                        # Store raw level without calling callback directly
+                        # This prevents ScriptRunContext warnings
+                        self.raw_audio_level = (rms, peak, time.time())
+                        
+                        time.sleep(0.05)  # 20 FPS update rate
+                        
+                except Exception as e:
+                    print(f"Audio monitoring error: {e}")
+                finally:
+                    stream.stop_stream()
+                    stream.close()
+                    p.terminate()
+            
+            # Start monitoring thread
+            self.monitoring_thread = threading.Thread(target=monitor_audio, daemon=True)
+            self.monitoring_thread.start()
+            
+            return {
+                "success": True,
+                "message": "Audio monitoring started"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def stop_audio_monitoring(self):
+        """Stop audio monitoring"""
+        self.monitoring_active = False
+        if self.monitoring_thread is not None:
+            self.monitoring_thread.join(timeout=1.0)
+            self.monitoring_thread = None
+        return {"success": True, "message": "Audio monitoring stopped"}
+    
+    def update_monitoring_gain(self, gain_multiplier: float) -> None:
+        """Change the monitoring gain without reopening the audio stream"""
+        # The monitor thread only stores raw levels; the gain is applied in
+        # get_current_audio_level, so the new value shows on the next read
+        self.monitor_gain = gain_multiplier
+    
+    def get_current_audio_level(self) -> AudioLevel:
+        """
+        Get current audio level from monitoring thread
+        This method is safe to call from Streamlit UI
+        
+        Returns:
+            AudioLevel snapshot of the current audio level
+        """
+        rms, peak, timestamp = self.raw_audio_level
+        gain = self.monitor_gain
+        
+        # Normalize to 0-1 range
+        rms_normalized = min(1.0, rms * gain / 32767.0)
+        peak_normalized = min(1.0, peak * gain / 32767.0)
+        
+        return AudioLevel(rms_normalized, peak_normalized, gain, peak_normalized > 0.95, timestamp)
+
 
 class VoiceCloner:
     def __init__(self):
@@ -37,16 +200,8 @@ class VoiceCloner:
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.whisper_model = None
         self.recording_active = False
-        self.monitoring_active = False
-        self.monitoring_thread = None
-        self.audio_buffer = []
-        self.current_audio_level = {
-            'rms_level': 0.0,
-            'peak_level': 0.0,
-            'gain': 1.0,
-            'clipping': False,
-            'timestamp': 0.0
-        }
+        # Default monitor for callers outside the UI; the app keeps its own per session
+        self.audio_monitor = AudioMonitor()
         
         # Initialize Whisper for transcription
         try:
@@ -141,7 +296,8 @@ class VoiceCloner:
     def record_voice_from_microphone(self, duration: int, output_path: str, 
                                    gain_multiplier: float = 1.0, 
                                    device_index: Optional[int] = None,
-                                   progress_callback: Optional[callable] = None) -> Dict:
+                                   progress_callback: Optional[callable] = None,
+                                   stop_event: Optional[threading.Event] = None) -> Dict:
         """
         Record voice from microphone with gain control and progress tracking
         
@@ -151,6 +307,7 @@ class VoiceCloner:
             gain_multiplier: Audio gain multiplier (0.1 to 5.0)
             device_index: Specific microphone device index
             progress_callback: Callback function for progress updates
+            stop_event: Event that ends the recording early when set
             
         Returns:
             Dictionary with recording results
@@ -189,17 +346,21 @@ class VoiceCloner:
             
             # Record audio with progress tracking
             for i in range(total_chunks):
+                if stop_event is not None and stop_event.is_set():
+                    break
+                
                 data = stream.read(chunk)
+                # Zero-copy int16 view of the PyAudio buffer
+                audio_chunk = np.frombuffer(data, dtype=np.int16)
                 
                 # Apply gain adjustment
                 if gain_multiplier != 1.0:
-                    # Convert to numpy array, apply gain, convert back
-                    audio_chunk = np.frombuffer(data, dtype=np.int16)
-                    audio_chunk = audio_chunk.astype(np.float32)
-                    audio_chunk *= gain_multiplier
+                    scaled = audio_chunk.astype(np.float32)
+                    scaled *= gain_multiplier
                     # Prevent clipping
-                    audio_chunk = np.clip(audio_chunk, -32767, 32767)
-                    data = audio_chunk.astype(np.int16).tobytes()
+                    np.clip(scaled, -32767, 32767, out=scaled)
+                    audio_chunk = scaled.astype(np.int16)
+                    data = audio_chunk.tobytes()
                 
                 frames.append(data)
                 
@@ -210,9 +371,8 @@ class VoiceCloner:
                     remaining_time = duration - elapsed_time
                     
                     # Calculate current audio level for visual feedback
-                    audio_level = np.sqrt(np.mean(
-                        np.frombuffer(data, dtype=np.int16).astype(np.float32) ** 2
-                    )) / 32767.0
+                    samples = audio_chunk.astype(np.float32)
+                    audio_level = float(np.sqrt(np.dot(samples, samples) / samples.size)) / 32767.0
                     
                     progress_callback({
                         'progress': progress,
@@ -222,6 +382,9 @@ class VoiceCloner:
                         'gain': gain_multiplier
                     })
             
+            # Actual recorded length (shorter if stopped early)
+            duration = len(frames) * chunk / rate
+            
             # Stop recording
             stream.stop_stream()
             stream.close()
@@ -671,151 +834,20 @@ class VoiceCloner:
     
     def start_audio_monitoring(self, device_index: Optional[int] = None, 
                              gain_multiplier: float = 1.0) -> Dict:
-        """
-        Start real-time audio level monitoring
-        
-        Args:
-            device_index: Microphone device index
-            gain_multiplier: Audio gain multiplier
-            callback: Callback function for level updates
-            
-        Returns:
-            Dictionary with monitoring status
-        """
-        if not PYAUDIO_AVAILABLE:
-            return {"success": False, "error": "PyAudio not available. Cannot start audio monitoring."}
-        
-        try:
-            import threading
-            
-            # Initialize PyAudio first to check device capabilities
-            p = pyaudio.PyAudio()
-            
-            # Get device info if device_index is specified
-            if device_index is not None:
-                try:
-                    device_info = p.get_device_info_by_index(device_index)
-                    max_channels = int(device_info.get('maxInputChannels', 1))
-                    default_rate = int(device_info.get('defaultSampleRate', 44100))
-                except:
-                    # Fallback if device info fails
-                    max_channels = 1
-                    default_rate = 44100
-            else:
-                max_channels = 1
-                default_rate = 44100
-            
-            # Safe audio parameters with fallbacks
-            chunk = 1024
-            format = pyaudio.paInt16
-            channels = min(1, max_channels)  # Use 1 channel (mono) for safety
-            
-            # Try different sample rates in order of preference
-            rate_options = [default_rate, 44100, 48000, 22050, 16000]
-            rate = 44100  # Default fallback
-            
-            stream = None
-            last_error = None
-            for test_rate in rate_options:
-                try:
-                    # Test stream creation with current parameters
-                    test_stream = p.open(
-                        format=format,
-                        channels=channels,
-                        rate=int(test_rate),
-                        input=True,
-                        input_device_index=device_index,
-                        frames_per_buffer=chunk
-                    )
-                    # If successful, use these parameters
-                    rate = int(test_rate)
-                    stream = test_stream
-                    break
-                except Exception as e:
-                    # Continue trying other rates
-                    last_error = str(e)
-                    continue
-            
-            if stream is None:
-                p.terminate()
-                error_detail = f"Cannot open audio stream with any supported parameters. Last error: {last_error}" if last_error else "Cannot open audio stream with any supported parameters"
-                return {"success": False, "error": error_detail}
-            
-            self.monitoring_active = True
-            
-            def monitor_audio():
-                """Audio monitoring thread function"""
-                try:
-                    while self.monitoring_active:
-                        # Read audio data
-                        data = stream.read(chunk, exception_on_overflow=False)
-                        
-                        # Convert to numpy array and apply gain
-                        audio_chunk = np.frombuffer(data, dtype=np.int16)
-                        audio_chunk = audio_chunk.astype(np.float32)
-                        audio_chunk *= gain_multiplier
-                        
-                        # Calculate audio level
-                        rms = np.sqrt(np.mean(audio_chunk ** 2))
-                        peak = np.max(np.abs(audio_chunk))
-                        
-                        # Normalize to 0-1 range
-                        rms_normalized = min(1.0, rms / 32767.0)
-                        peak_normalized = min(1.0, peak / 32767.0)
-                        
-                        # Check for clipping
-                        clipping = peak_normalized > 0.95
-                        
-                        # Store level data without calling callback directly
-                        # This prevents ScriptRunContext warnings
-                        self.current_audio_level = {
-                            'rms_level': rms_normalized,
-                            'peak_level': peak_normalized,
-                            'gain': gain_multiplier,
-                            'clipping': clipping,
-                            'timestamp': time.time()
-                        }
-                        
-                        time.sleep(0.05)  # 20 FPS update rate
-                        
-                except Exception as e:
-                    print(f"Audio monitoring error: {e}")
-                finally:
-                    stream.stop_stream()
-                    stream.close()
-                    p.terminate()
-            
-            # Start monitoring thread
-            self.monitoring_thread = threading.Thread(target=monitor_audio, daemon=True)
-            self.monitoring_thread.start()
-            
-            return {
-                "success": True,
-                "message": "Audio monitoring started"
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        """Start real-time audio level monitoring on the default monitor"""
+        return self.audio_monitor.start_audio_monitoring(device_index, gain_multiplier)
     
     def stop_audio_monitoring(self):
         """Stop audio monitoring"""
-        self.monitoring_active = False
-        if hasattr(self, 'monitoring_thread'):
-            self.monitoring_thread.join(timeout=1.0)
-        return {"success": True, "message": "Audio monitoring stopped"}
+        return self.audio_monitor.stop_audio_monitoring()
     
-    def get_current_audio_level(self) -> Dict:
-        """
-        Get current audio level from monitoring thread
-        This method is safe to call from Streamlit UI
-        
-        Returns:
-            Dictionary with current audio level data
-        """
-        return self.current_audio_level.copy()
+    def update_monitoring_gain(self, gain_multiplier: float) -> None:
+        """Change the monitoring gain without reopening the audio stream"""
+        self.audio_monitor.update_monitoring_gain(gain_multiplier)
+    
+    def get_current_audio_level(self) -> AudioLevel:
+        """Get current audio level from the default monitor"""
+        return self.audio_monitor.get_current_audio_level()
     
     def get_audio_level_preview(self, device_index: Optional[int] = None, 
                               gain_multiplier: float = 1.0, 
@@ -895,14 +927,13 @@ class VoiceCloner:
             for _ in range(max(1, frames_to_read)):
                 data = stream.read(chunk, exception_on_overflow=False)
                 
-                # Convert to numpy array and apply gain
+                # Integer math on the int16 samples (gain is linear, so apply it to the levels)
                 audio_chunk = np.frombuffer(data, dtype=np.int16)
-                audio_chunk = audio_chunk.astype(np.float32)
-                audio_chunk *= gain_multiplier
+                wide = audio_chunk.astype(np.int64)
                 
                 # Calculate levels
-                rms = np.sqrt(np.mean(audio_chunk ** 2))
-                peak = np.max(np.abs(audio_chunk))
+                rms = math.sqrt(int(np.dot(wide, wide)) / wide.size) * gain_multiplier
+                peak = max(-int(audio_chunk.min()), int(audio_chunk.max())) * gain_multiplier
                 
                 audio_levels.append({
                     'rms': min(1.0, rms / 32767.0),
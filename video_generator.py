@@ -3,10 +3,15 @@ import tempfile
 from pathlib import Path
 from typing import Optional, Dict, List
 import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from config import Config
 from utils.script_generator import ScriptGenerator
 from utils.tts_engine import TTSEngine
+from utils.voice_cloner import AudioLevel
 from utils.video_composer import VideoComposer
 from utils.face_animator_simple import SimpleFaceAnimator
 
@@ -68,7 +73,6 @@ class AutoVideoGenerator:
                 return {"success": False, "error": "News topic is required"}
             
             # Generate unique filename for this video
-            import uuid
             video_id = str(uuid.uuid4())[:8]
             base_filename = f"news_video_{video_id}"
             
@@ -206,27 +210,38 @@ class AutoVideoGenerator:
     
     def cleanup_old_files(self, days_old: int = 7):
         """Clean up old temporary and output files"""
-        import time
         current_time = time.time()
         cutoff_time = current_time - (days_old * 24 * 60 * 60)
         
         directories_to_clean = [Config.TEMP_DIR, Config.OUTPUT_DIR]
-        cleaned_files = []
         
+        # Collect expired files with one scandir pass per directory
+        expired_files = []
         for directory in directories_to_clean:
             if os.path.exists(directory):
-                for filename in os.listdir(directory):
-                    file_path = os.path.join(directory, filename)
-                    if os.path.isfile(file_path):
-                        file_time = os.path.getmtime(file_path)
-                        if file_time < cutoff_time:
-                            try:
-                                os.remove(file_path)
-                                cleaned_files.append(file_path)
-                            except Exception as e:
-                                print(f"Error cleaning {file_path}: {e}")
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                            expired_files.append(entry.path)
         
-        return cleaned_files
+        if not expired_files:
+            return []
+        
+        # Unlink in parallel; the work is bound by filesystem latency, not CPU
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            removed = pool.map(self._remove_file, expired_files)
+        
+        return [path for path, ok in zip(expired_files, removed) if ok]
+    
+    @staticmethod
+    def _remove_file(file_path: str) -> bool:
+        """Delete one file, reporting failures instead of raising"""
+        try:
+            os.remove(file_path)
+            return True
+        except Exception as e:
+            print(f"Error cleaning {file_path}: {e}")
+            return False
     
     def extract_voice_from_video(self, video_path: str, output_path: str) -> Dict:
         """Extract voice from video file"""
@@ -239,14 +254,16 @@ class AutoVideoGenerator:
     def record_voice_from_microphone(self, duration: int, output_path: str, 
                                    gain_multiplier: float = 1.0,
                                    device_index: Optional[int] = None,
-                                   progress_callback: Optional[callable] = None) -> Dict:
+                                   progress_callback: Optional[callable] = None,
+                                   stop_event: Optional[threading.Event] = None) -> Dict:
         """Record voice from microphone with gain control and progress tracking"""
         return self.tts_engine.record_voice_from_microphone(
             duration=duration, 
             output_path=output_path,
             gain_multiplier=gain_multiplier,
             device_index=device_index,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            stop_event=stop_event
         )
     
     def create_voice_samples_from_media(self, media_path: str, media_type: str = "auto") -> Dict:
@@ -261,7 +278,6 @@ class AutoVideoGenerator:
             Dictionary with voice sample creation results
         """
         try:
-            import uuid
             session_id = str(uuid.uuid4())[:8]
             temp_audio_path = os.path.join(Config.TEMP_DIR, f"extracted_audio_{session_id}.wav")
             voice_samples_dir = os.path.join(Config.TEMP_DIR, f"voice_samples_{session_id}")
@@ -321,7 +337,11 @@ class AutoVideoGenerator:
         """Stop audio monitoring"""
         return self.tts_engine.stop_audio_monitoring()
     
-    def get_current_audio_level(self) -> Dict:
+    def update_monitoring_gain(self, gain_multiplier: float) -> None:
+        """Change the monitoring gain without restarting the stream"""
+        self.tts_engine.update_monitoring_gain(gain_multiplier)
+    
+    def get_current_audio_level(self) -> AudioLevel:
         """Get current audio level from monitoring thread"""
         return self.tts_engine.get_current_audio_level()
     
@@ -365,7 +385,6 @@ class AutoVideoGenerator:
                 return {"success": False, "error": "Script text is required"}
             
             # Generate unique filename for this video
-            import uuid
             video_id = str(uuid.uuid4())[:8]
             base_filename = f"lipsync_video_{video_id}"
             